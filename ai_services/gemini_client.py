@@ -14,6 +14,21 @@ class LearningPathStructure(BaseModel):
     difficulty: str
     daily_plans: List[Dict[str, Any]]
 
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _generate_json_text(_client, model: str, prompt: str) -> str:
+    """Generate a JSON response; identical prompts reuse the cached text"""
+    response = _client.models.generate_content(
+        model=model,
+        contents=prompt,
+        config=types.GenerateContentConfig(
+            response_mime_type="application/json"
+        )
+    )
+    if not response.text:
+        # Raise so empty responses are not cached
+        raise ValueError("Empty response from Gemini")
+    return response.text
+
 class GeminiClient:
     def __init__(self):
         self.client = None
@@ -76,16 +91,10 @@ class GeminiClient:
             Include only {goal}-related content, code examples, and hands-on exercises.
             """
 
-            response = self.client.models.generate_content(
-                model="gemini-2.5-flash",
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json"
-                )
-            )
+            response_text = _generate_json_text(self.client, "gemini-2.5-flash", prompt)
 
-            if response.text:
-                learning_path = json.loads(response.text)
+            if response_text:
+                learning_path = json.loads(response_text)
                 learning_path['type'] = 'normal'
                 learning_path['created_with_ai'] = True
                 return learning_path
@@ -158,16 +167,10 @@ class GeminiClient:
             Make the path truly adaptive and context-aware, not just a regular learning path labeled as MCP.
             """
 
-            response = self.client.models.generate_content(
-                model="gemini-2.5-pro",
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json"
-                )
-            )
+            response_text = _generate_json_text(self.client, "gemini-2.5-pro", prompt)
 
-            if response.text:
-                learning_path = json.loads(response.text)
+            if response_text:
+                learning_path = json.loads(response_text)
                 learning_path['type'] = 'mcp'
                 learning_path['created_with_ai'] = True
                 return learning_path
@@ -291,16 +294,10 @@ class GeminiClient:
             Return the enhanced plan in the same JSON format.
             """
 
-            response = self.client.models.generate_content(
-                model="gemini-2.5-flash",
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json"
-                )
-            )
+            response_text = _generate_json_text(self.client, "gemini-2.5-flash", prompt)
 
-            if response.text:
-                return json.loads(response.text)
+            if response_text:
+                return json.loads(response_text)
             
         except Exception as e:
             st.error(f"Failed to enhance content: {str(e)}")
@@ -1,10 +1,16 @@
 import streamlit as st
 import os
-from datetime import datetime, timedelta
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import pandas as pd
+import re
+import asyncio
+import gzip
+import threading
+import requests
+from datetime import datetime, time, timezone
+from functools import lru_cache, partial
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from string import Template
+from tempfile import SpooledTemporaryFile
 
 # Import our modules
 from auth.firebase_auth import firebase_auth
@@ -19,16 +25,45 @@ from integrations.drive_client import drive_client
 from utils.helpers import *
 from config.settings import settings
 
-# Page configuration
-st.set_page_config(
-    page_title="AI Learning Path Generator",
-    page_icon="🎓",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+# Worker pool for slow, non-critical work kept off the script thread
+_background_executor = ThreadPoolExecutor(max_workers=4)
+
+# Progress writes are serialized so read-modify-write updates don't race
+_progress_write_executor = ThreadPoolExecutor(max_workers=1)
+
+# Known display values for path difficulty and type
+_DIFFICULTY_CATEGORIES = ("Beginner", "Intermediate", "Advanced", "Expert")
+_TYPE_CATEGORIES = ("NORMAL", "MCP")
 
-# Custom CSS for better styling
-st.markdown("""
+# Learning paths shown per dashboard page
+_DASHBOARD_PAGE_SIZE = 3
+
+# Above this many learning paths the progress chart renders with WebGL
+_WEBGL_PATH_THRESHOLD = 50
+
+# Above this many days the calendar and activity charts render with WebGL
+_WEBGL_DAY_THRESHOLD = 50
+
+# Weekday names in reminder order, and their schedule indices
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_DAY_INDEX = {day: i for i, day in enumerate(_WEEKDAYS)}
+
+# Default daily reminder time
+_DEFAULT_REMINDER_TIME = time(9, 0)
+
+# Most daily plan audio generations kept; the oldest finished ones are evicted first
+_MAX_PLAN_AUDIO_JOBS = 32
+
+# Display labels and icons for notification methods
+_NOTIF_METHOD_LABELS = {"sms": "📱 SMS", "whatsapp": "💬 WhatsApp", "voice": "📞 Voice Call"}
+_NOTIF_METHOD_ICONS = {"sms": "📱", "whatsapp": "💬", "voice": "📞"}
+
+def _minify_css(css: str) -> str:
+    """Collapse stylesheet whitespace so each rerun sends a smaller delta"""
+    return re.sub(r'\s*([{}:;,>])\s*', r'\1', re.sub(r'\s+', ' ', css)).strip()
+
+# Static stylesheet, minified once at import
+_APP_CSS = _minify_css("""
 <style>
     .main-header {
         background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
@@ -57,6 +92,23 @@ st.markdown("""
         margin: 0.5rem;
     }
     
+    .metric-row {
+        display: flex;
+    }
+    
+    .metric-row .metric-card {
+        flex: 1;
+    }
+    
+    .card-row {
+        display: flex;
+        gap: 1rem;
+    }
+    
+    .card-row .feature-card {
+        flex: 1;
+    }
+    
     .progress-container {
         background: #f8f9fa;
         padding: 1rem;
@@ -102,7 +154,260 @@ st.markdown("""
         box-shadow: 0 4px 12px rgba(102, 126, 234, 0.4);
     }
 </style>
-""", unsafe_allow_html=True)
+""")
+
+# HTML card templates
+_PATH_CARD_TPL = Template("""
+    <div class="feature-card">
+        <h4>$goal</h4>
+        <p><strong>Duration:</strong> $duration days | 
+           <strong>Difficulty:</strong> $difficulty |
+           <strong>Type:</strong> $path_type</p>
+    </div>
+    """)
+_RECOMMENDATION_CARD_TPL = Template("""
+    <div class="feature-card">
+        <h4>$title</h4>
+        <p>$description</p>
+        <p><strong>Duration:</strong> $duration days</p>
+        <p><strong>Difficulty:</strong> $difficulty</p>
+    </div>
+    """)
+_VIDEO_CARD_TPL = Template("""
+    <div class="feature-card">
+        <h5>$title</h5>
+        <p>$channel</p>
+        <a href="$url" target="_blank">🎥 Watch Video</a>
+    </div>
+    """)
+_DAY_CARD_TPL = Template("""
+                <div class="$card_class">
+                    <h4>Day $day: $title</h4>
+                    <p><strong>Estimated Time:</strong> $estimated_time</p>
+                    <p><strong>Objectives:</strong> $objective_count learning objectives</p>
+                </div>
+                """)
+_METRICS_ROW_TPL = Template("""
+    <div class="metric-row">
+        <div class="metric-card"><h2>$total_paths</h2><p>Learning Paths</p></div>
+        <div class="metric-card"><h2>$completed_paths</h2><p>Completed</p></div>
+        <div class="metric-card"><h2>$total_days_studied</h2><p>Days Studied</p></div>
+        <div class="metric-card"><h2>$current_streak</h2><p>Current Streak</p></div>
+    </div>
+    """)
+
+# Page configuration
+st.set_page_config(
+    page_title="AI Learning Path Generator",
+    page_icon="🎓",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Custom CSS for better styling (re-sent each run; Streamlit drops
+# elements that a rerun doesn't emit)
+st.markdown(_APP_CSS, unsafe_allow_html=True)
+
+@lru_cache(maxsize=512)
+def _path_card_html(goal: str, duration: int, difficulty: str, path_type: str) -> str:
+    """Render (and cache) the feature card for a learning path"""
+    return _PATH_CARD_TPL.substitute(
+        goal=goal, duration=duration, difficulty=difficulty.title(), path_type=path_type.upper()
+    )
+
+@lru_cache(maxsize=512)
+def _recommendation_card_html(title: str, description: str, duration: int, difficulty: str) -> str:
+    """Render (and cache) the feature card for a recommendation"""
+    return _RECOMMENDATION_CARD_TPL.substitute(
+        title=title, description=description, duration=duration, difficulty=difficulty.title()
+    )
+
+@lru_cache(maxsize=128)
+def _recommendation_row_html(cards: tuple) -> str:
+    """Render (and cache) recommendation cards side by side as a single block"""
+    return '<div class="card-row">' + ''.join(_recommendation_card_html(*card) for card in cards) + '</div>'
+
+@lru_cache(maxsize=512)
+def _metrics_row_html(total_paths: int, completed_paths: int, total_days_studied: int, current_streak: int) -> str:
+    """Render (and cache) the dashboard metrics row as a single block"""
+    return _METRICS_ROW_TPL.substitute(
+        total_paths=total_paths, completed_paths=completed_paths,
+        total_days_studied=total_days_studied, current_streak=current_streak
+    )
+
+@lru_cache(maxsize=512)
+def _video_card_html(title: str, channel: str, url: str) -> str:
+    """Render (and cache) the feature card for a recommended video"""
+    return _VIDEO_CARD_TPL.substitute(title=title, channel=channel, url=url)
+
+@st.cache_data(ttl=60, max_entries=256, show_spinner=False)
+def _fetch_user_paths(user_id: str, version: int) -> list:
+    """Fetch a user's learning paths; version is bumped to invalidate"""
+    return learning_service.get_user_learning_paths(user_id)
+
+@st.cache_data(ttl=60, max_entries=256, show_spinner=False)
+def _fetch_path_options(user_id: str, version: int) -> dict:
+    """Map each learning path goal to its id, for path selectors"""
+    options = {}
+    for i, p in enumerate(_fetch_user_paths(user_id, version)):
+        label = p.get('goal', f"Path {i}")
+        # Paths sharing a goal each keep their own entry
+        if label in options:
+            label = f"{label} ({i + 1})"
+        options[label] = p.get('id', '')
+    return options
+
+@st.cache_data(ttl=60, max_entries=256, show_spinner=False)
+def _fetch_user_path(user_id: str, path_id: str, version: int):
+    """Fetch a single learning path; version is bumped to invalidate"""
+    return learning_service.get_learning_path(user_id, path_id)
+
+@st.cache_data(ttl=60, max_entries=256, show_spinner=False)
+def _fetch_user_paths_page(user_id: str, limit: int, cursor, version: int) -> tuple:
+    """Fetch one page of a user's learning paths; version is bumped to invalidate"""
+    return learning_service.get_user_learning_paths_page(user_id, limit, cursor)
+
+@st.cache_data(ttl=60, max_entries=256, show_spinner=False)
+def _fetch_path_summary(user_id: str, version: int) -> dict:
+    """Summarize a user's learning paths for the dashboard and analytics; version is bumped to invalidate"""
+    return learning_service.get_learning_analytics(user_id, _fetch_user_paths(user_id, version))
+
+@st.cache_data(ttl=60, max_entries=256, show_spinner=False)
+def _fetch_recommendations(user_id: str, version: int) -> list:
+    """Recommend next learning paths from a user's history; version is bumped to invalidate"""
+    return learning_service.get_learning_recommendations(user_id, _fetch_user_paths(user_id, version))
+
+@st.cache_data(ttl=300, max_entries=64, show_spinner=False)
+def _fetch_export(user_id: str, path_id: str, format_type: str, compress: bool, version: int):
+    """Build a learning path export payload (None on failure); version is bumped to invalidate"""
+    # Small exports stay in memory, large ones spill to disk
+    with SpooledTemporaryFile(max_size=1 << 20) as export_file:
+        if not learning_service.export_learning_path(user_id, path_id, export_file, format_type):
+            return None
+        export_file.seek(0)
+        payload = export_file.read()
+    # Repeated keys make JSON compress well, so less is sent to the browser
+    return gzip.compress(payload, mtime=0) if compress else payload
+
+def _cached_user_paths(user_id: str) -> list:
+    """Get a user's learning paths, cached across reruns"""
+    return _fetch_user_paths(user_id, st.session_state.get('paths_version', 0))
+
+def _cached_path_options(user_id: str) -> dict:
+    """Get the goal-to-id options for a user's learning paths, cached across reruns"""
+    return _fetch_path_options(user_id, st.session_state.get('paths_version', 0))
+
+def _cached_path_summary(user_id: str) -> dict:
+    """Get the learning path summary, shared by the dashboard and analytics pages"""
+    return _fetch_path_summary(user_id, st.session_state.get('paths_version', 0))
+
+def _cached_recommendations(user_id: str) -> list:
+    """Get learning path recommendations, cached across reruns"""
+    return _fetch_recommendations(user_id, st.session_state.get('paths_version', 0))
+
+def _cached_user_path(user_id: str, path_id: str):
+    """Get a single learning path, cached across reruns"""
+    return _fetch_user_path(user_id, path_id, st.session_state.get('paths_version', 0))
+
+def _cached_export(user_id: str, path_id: str, format_type: str, compress: bool = False):
+    """Get a learning path export payload, cached until the paths change"""
+    return _fetch_export(user_id, path_id, format_type, compress, st.session_state.get('paths_version', 0))
+
+def _cached_recent_paths(user_id: str, pages: int, page_size: int) -> tuple:
+    """Get the newest learning paths one cached page at a time
+
+    Returns the paths from the first ``pages`` pages and whether more exist.
+    """
+    version = st.session_state.get('paths_version', 0)
+    prefetched = st.session_state.setdefault('prefetched_path_pages', {})
+    paths, cursor = [], None
+    for _ in range(pages):
+        page_key = (user_id, page_size, cursor, version)
+        prefetch = prefetched.get(page_key)
+        page = None
+        if prefetch is not None and prefetch.exception() is None:
+            page, next_cursor = prefetch.result()
+        if page:
+            cursor = next_cursor
+        else:
+            # No prefetch, or it failed or came back empty: drop it and fetch
+            # here, where errors can be shown
+            prefetched.pop(page_key, None)
+            page, cursor = _fetch_user_paths_page(user_id, page_size, cursor, version)
+        paths.extend(page)
+        if cursor is None:
+            break
+    
+    # Prefetch the next page while this one renders so "Show More" is instant
+    if cursor is not None:
+        next_key = (user_id, page_size, cursor, version)
+        if next_key not in prefetched:
+            prefetched[next_key] = _background_executor.submit(
+                learning_service.read_user_learning_paths_page, user_id, page_size, cursor
+            )
+    return paths, cursor is not None
+
+def _clear_path_caches():
+    """Invalidate this session's cached learning path data after it changes"""
+    st.session_state.paths_version = st.session_state.get('paths_version', 0) + 1
+    st.session_state.prefetched_path_pages = {}
+
+@st.cache_data(ttl=30, max_entries=512, show_spinner=False)
+def _cached_history(user_id: str) -> list:
+    """Fetch a user's notification history, cached across reruns"""
+    return notification_service.get_notification_history(user_id)
+
+@st.cache_resource
+def _plan_audio_jobs() -> tuple:
+    """Audio generations shared across sessions, keyed by (path_id, day, content), and their lock"""
+    return OrderedDict(), threading.Lock()
+
+def _get_plan_audio(job_key: tuple):
+    """Get the audio generation for job_key, or None if it was never started or was evicted"""
+    jobs, lock = _plan_audio_jobs()
+    with lock:
+        return jobs.get(job_key)
+
+def _start_plan_audio(path_id: str, day: int, plan: dict) -> tuple:
+    """Start (or reuse) the narrated audio generation for a daily plan
+
+    Only the plain TTS call runs on the executor; the cache lookup stays on
+    the script thread, which has the ScriptRunContext Streamlit needs.
+    """
+    job_key = (path_id, day, plan.get('content', ''))
+    jobs, lock = _plan_audio_jobs()
+    with lock:
+        future = jobs.get(job_key)
+        # Failed generations are retried rather than served from the cache
+        if future is None or (future.done() and future.exception() is not None):
+            if elevenlabs_client.demo_mode:
+                # The demo placeholder is local and instant (and reports via st.info)
+                future = Future()
+                future.set_result(elevenlabs_client.create_audio_for_daily_plan(plan))
+            else:
+                future = _background_executor.submit(elevenlabs_client.synthesize_daily_plan, plan)
+            jobs[job_key] = future
+        jobs.move_to_end(job_key)
+        
+        # Evict the least recently used finished jobs; pending ones are still awaited
+        excess = len(jobs) - _MAX_PLAN_AUDIO_JOBS
+        for key in [key for key, job in jobs.items() if job.done() and key != job_key][:max(excess, 0)]:
+            del jobs[key]
+    return job_key
+
+@st.fragment(run_every=2)
+def _await_plan_audio(job_key: tuple):
+    """Poll a pending audio generation and rerun the app once it finishes"""
+    audio_future = _get_plan_audio(job_key)
+    if audio_future is None or audio_future.done():
+        st.rerun()
+    st.info("🎵 Generating audio...")
+
+def _celebrate_once(flag: str):
+    """Show balloons only the first time a success happens in this session"""
+    if settings.ENABLE_CELEBRATIONS and not st.session_state.get(flag):
+        st.balloons()
+        st.session_state[flag] = True
 
 def main():
     """Main application function"""
@@ -155,7 +460,7 @@ def show_signin_form():
                     if user:
                         st.session_state.authenticated = True
                         st.session_state.user = user
-                        st.success("Welcome back!")
+                        st.toast("✅ Welcome back!")
                         st.rerun()
                     else:
                         st.error("Invalid credentials")
@@ -168,7 +473,7 @@ def show_signin_form():
                 if user:
                     st.session_state.authenticated = True
                     st.session_state.user = user
-                    st.success("Welcome!")
+                    st.toast("✅ Welcome!")
                     st.rerun()
         
         with col3:
@@ -178,7 +483,7 @@ def show_signin_form():
                 if user:
                     st.session_state.authenticated = True
                     st.session_state.user = user
-                    st.success("Demo mode activated!")
+                    st.toast("🎯 Demo mode activated!")
                     st.rerun()
 
 def show_signup_form():
@@ -205,7 +510,7 @@ def show_signup_form():
                 if user:
                     st.session_state.authenticated = True
                     st.session_state.user = user
-                    st.success("Account created successfully!")
+                    st.toast("✅ Account created successfully!")
                     st.rerun()
                 else:
                     st.error("Failed to create account")
@@ -228,7 +533,8 @@ def show_main_app():
             "Navigate",
             ["🏠 Dashboard", "➕ Create Learning Path", "📚 My Learning Paths", 
              "📊 Progress Analytics", "🔔 Notifications", "🔑 API Keys", "⚙️ Settings"],
-            key="main_navigation"
+            key="main_navigation",
+            on_change=st.query_params.clear
         )
         
         st.markdown("---")
@@ -240,12 +546,14 @@ def show_main_app():
                 del st.session_state.user
             st.rerun()
     
-    # Main content based on selected page
-    # Handle redirects
-    if 'redirect_to' in st.session_state:
-        page = st.session_state.redirect_to
-        del st.session_state.redirect_to
+    # Single-path views are routed via query params, so they render
+    # without loading every learning path
+    routed_view = st.query_params.get("view")
+    if routed_view in ("details", "reminders"):
+        show_routed_path_view(user_id, routed_view, st.query_params.get("pid", ""))
+        return
     
+    # Main content based on selected page
     if page == "🏠 Dashboard":
         show_dashboard(user_id)
     elif page == "➕ Create Learning Path":
@@ -261,6 +569,36 @@ def show_main_app():
     elif page == "⚙️ Settings":
         show_settings(user_id)
 
+def _navigate_to(page: str, selected_path: dict = None):
+    """Switch the sidebar navigation to another page before the next run"""
+    st.query_params.clear()
+    st.session_state.main_navigation = page
+    if selected_path is not None:
+        st.session_state.selected_path = selected_path
+
+def _show_more_paths():
+    """Load one more page of dashboard paths on the next run"""
+    st.session_state.dashboard_path_pages = st.session_state.get('dashboard_path_pages', 1) + 1
+
+def _open_path_view(view: str, path_id: str):
+    """Route to a single learning path view via query params"""
+    st.query_params["view"] = view
+    st.query_params["pid"] = path_id
+
+def show_routed_path_view(user_id: str, view: str, path_id: str):
+    """Show a query-param routed view of a single learning path"""
+    st.button("⬅️ Back to My Learning Paths", on_click=st.query_params.clear)
+    
+    path = _cached_user_path(user_id, path_id)
+    if not path:
+        st.error("Learning path not found")
+        return
+    
+    if view == "details":
+        show_learning_path_details(user_id, path)
+    else:
+        show_notification_setup(user_id, path_id)
+
 def show_dashboard(user_id: str):
     """Show dashboard"""
     st.markdown("""
@@ -271,93 +609,70 @@ def show_dashboard(user_id: str):
     """, unsafe_allow_html=True)
     
     # Get user analytics
-    analytics = learning_service.get_learning_analytics(user_id)
-    
-    # Metrics row
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h2>{analytics.get('total_paths', 0)}</h2>
-            <p>Learning Paths</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h2>{analytics.get('completed_paths', 0)}</h2>
-            <p>Completed</p>
-        </div>
-        """, unsafe_allow_html=True)
+    analytics = _cached_path_summary(user_id)
     
-    with col3:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h2>{analytics.get('total_days_studied', 0)}</h2>
-            <p>Days Studied</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h2>{analytics.get('current_streak', 0)}</h2>
-            <p>Current Streak</p>
-        </div>
-        """, unsafe_allow_html=True)
+    # Metrics row, sent as one element instead of four columns
+    st.markdown(_metrics_row_html(
+        analytics.get('total_paths', 0),
+        analytics.get('completed_paths', 0),
+        analytics.get('total_days_studied', 0),
+        analytics.get('current_streak', 0)
+    ), unsafe_allow_html=True)
     
-    # Recent learning paths
+    # Recent learning paths, fetched a page at a time
     st.subheader("📚 Recent Learning Paths")
-    learning_paths = learning_service.get_user_learning_paths(user_id)
+    recent_paths, has_more = _cached_recent_paths(
+        user_id, st.session_state.get('dashboard_path_pages', 1), _DASHBOARD_PAGE_SIZE
+    )
     
-    if learning_paths:
-        for path in learning_paths[:3]:  # Show last 3
+    if recent_paths:
+        for path in recent_paths:
             with st.container():
                 col1, col2, col3 = st.columns([3, 1, 1])
                 
                 with col1:
-                    st.markdown(f"""
-                    <div class="feature-card">
-                        <h4>{path.get('goal', 'Learning Path')}</h4>
-                        <p><strong>Duration:</strong> {path.get('duration_days', 0)} days | 
-                           <strong>Difficulty:</strong> {path.get('difficulty', 'Unknown').title()} |
-                           <strong>Type:</strong> {path.get('type', 'normal').upper()}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+                    st.markdown(_path_card_html(
+                        path.get('goal', 'Learning Path'),
+                        path.get('duration_days', 0),
+                        path.get('difficulty', 'Unknown'),
+                        path.get('type', 'normal')
+                    ), unsafe_allow_html=True)
                 
                 with col2:
                     completion = path.get('completion_percentage', 0)
                     st.metric("Progress", f"{completion:.1f}%")
                 
                 with col3:
-                    if st.button(f"Continue", key=f"continue_{path.get('id', '')}"):
-                        st.session_state.selected_path = path
-                        st.session_state.redirect_to = "📚 My Learning Paths"
-                        st.rerun()
+                    st.button(
+                        f"Continue", key=f"continue_{path.get('id', '')}",
+                        on_click=_navigate_to, args=("📚 My Learning Paths", path)
+                    )
+        
+        if has_more:
+            st.button("⬇️ Show More Paths", on_click=_show_more_paths)
     else:
         st.info("🚀 Ready to start your learning journey? Create your first learning path!")
-        if st.button("➕ Create Learning Path", use_container_width=True):
-            st.session_state.redirect_to = "➕ Create Learning Path"
-            st.rerun()
+        st.button(
+            "➕ Create Learning Path", use_container_width=True,
+            on_click=_navigate_to, args=("➕ Create Learning Path",)
+        )
     
     # Learning recommendations
     st.subheader("💡 Recommended Learning Paths")
-    recommendations = learning_service.get_learning_recommendations(user_id)
+    recommendations = _cached_recommendations(user_id)
     
     if recommendations:
-        cols = st.columns(min(3, len(recommendations)))
-        for i, rec in enumerate(recommendations[:3]):
-            with cols[i]:
-                st.markdown(f"""
-                <div class="feature-card">
-                    <h4>{rec.get('title', 'Recommendation')}</h4>
-                    <p>{rec.get('description', '')}</p>
-                    <p><strong>Duration:</strong> {rec.get('estimated_duration', 7)} days</p>
-                    <p><strong>Difficulty:</strong> {rec.get('difficulty', 'beginner').title()}</p>
-                </div>
-                """, unsafe_allow_html=True)
+        # One markdown element for the whole row instead of one per column
+        cards = tuple(
+            (
+                rec.get('title', 'Recommendation'),
+                rec.get('description', ''),
+                rec.get('estimated_duration', 7),
+                rec.get('difficulty', 'beginner')
+            )
+            for rec in recommendations[:3]
+        )
+        st.markdown(_recommendation_row_html(cards), unsafe_allow_html=True)
 
 def show_create_learning_path(user_id: str):
     """Show create learning path page"""
@@ -368,14 +683,14 @@ def show_create_learning_path(user_id: str):
     </div>
     """, unsafe_allow_html=True)
     
-    # Path type selection
-    path_type = st.radio(
-        "Choose Learning Path Type",
-        ["🎯 Normal Path", "🧠 MCP (Adaptive) Path"],
-        help="Normal paths provide structured learning. MCP paths adapt to your progress and learning style."
-    )
-    
     with st.form("create_path_form"):
+        # Path type selection (inside the form so toggling it doesn't rerun the page)
+        path_type = st.radio(
+            "Choose Learning Path Type",
+            ["🎯 Normal Path", "🧠 MCP (Adaptive) Path"],
+            help="Normal paths provide structured learning. MCP paths adapt to your progress and learning style."
+        )
+        
         col1, col2 = st.columns(2)
         
         with col1:
@@ -406,43 +721,40 @@ def show_create_learning_path(user_id: str):
                 help="Add practical exercises and projects to your learning path"
             )
         
-        # MCP-specific options
-        if "MCP" in path_type:
-            st.subheader("🧠 Enhanced MCP Configuration")
-            
-            # Check API key status
-            has_required_keys = api_key_manager.has_required_keys(user_id)
-            if not has_required_keys:
-                st.warning("⚠️ Enhanced MCP features require API keys. Configure them in the API Keys section.")
-                if st.button("🔑 Configure API Keys"):
-                    st.session_state.redirect_to = "🔑 API Keys"
-                    st.rerun()
+        # MCP-specific options (always rendered; only used for MCP paths)
+        st.subheader("🧠 Enhanced MCP Configuration")
+        st.caption("These options are only used when the MCP (Adaptive) path type is selected.")
+        
+        # Check API key status
+        has_required_keys = api_key_manager.has_required_keys(user_id)
+        if not has_required_keys:
+            st.warning("⚠️ Enhanced MCP features require API keys. Configure them in the API Keys section.")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            learning_style = st.selectbox(
+                "Preferred Learning Style",
+                ["visual", "auditory", "kinesthetic", "mixed"],
+                help="How do you learn best?"
+            )
             
-            col1, col2 = st.columns(2)
-            with col1:
-                learning_style = st.selectbox(
-                    "Preferred Learning Style",
-                    ["visual", "auditory", "kinesthetic", "mixed"],
-                    help="How do you learn best?"
-                )
-                
-                time_per_day = st.selectbox(
-                    "Available Time per Day",
-                    ["30 minutes", "1 hour", "2 hours", "3+ hours"],
-                    index=1
-                )
+            time_per_day = st.selectbox(
+                "Available Time per Day",
+                ["30 minutes", "1 hour", "2 hours", "3+ hours"],
+                index=1
+            )
+        
+        with col2:
+            previous_experience = st.text_area(
+                "Previous Experience",
+                placeholder="Describe any related knowledge or experience you have",
+                height=100
+            )
             
-            with col2:
-                previous_experience = st.text_area(
-                    "Previous Experience",
-                    placeholder="Describe any related knowledge or experience you have",
-                    height=100
-                )
-                
-                specific_interests = st.text_input(
-                    "Specific Interests",
-                    placeholder="Any particular aspects you're most interested in?"
-                )
+            specific_interests = st.text_input(
+                "Specific Interests",
+                placeholder="Any particular aspects you're most interested in?"
+            )
         
         if st.form_submit_button("🚀 Generate Learning Path", use_container_width=True):
             if not goal:
@@ -478,8 +790,9 @@ def show_create_learning_path(user_id: str):
                             if enhanced_path:
                                 path_id = learning_service.save_enhanced_learning_path(user_id, enhanced_path)
                                 if path_id:
+                                    _clear_path_caches()
                                     st.success("🎉 Enhanced MCP Learning Path created!")
-                                    st.balloons()
+                                    _celebrate_once("path_created_ever")
                                     
                                     # Show enhanced features
                                     st.subheader("🚀 Enhanced MCP Features Activated")
@@ -492,9 +805,10 @@ def show_create_learning_path(user_id: str):
                                         st.info("🤖 Advanced AI personalization")
                                         st.info("🔗 Multi-platform integration")
                                     
-                                    if st.button("📚 View Enhanced Learning Path"):
-                                        st.session_state.redirect_to = "📚 My Learning Paths"
-                                        st.rerun()
+                                    st.button(
+                                        "📚 View Enhanced Learning Path",
+                                        on_click=_navigate_to, args=("📚 My Learning Paths",)
+                                    )
                                     return
                         
                         path_data['mcp_context'] = mcp_context
@@ -502,11 +816,12 @@ def show_create_learning_path(user_id: str):
                     path_id = learning_service.create_learning_path(user_id, path_data)
                     
                     if path_id:
+                        _clear_path_caches()
                         st.success("🎉 Learning path created successfully!")
-                        st.balloons()
+                        _celebrate_once("path_created_ever")
                         
                         # Show quick preview
-                        learning_paths = learning_service.get_user_learning_paths(user_id)
+                        learning_paths = _cached_user_paths(user_id)
                         created_path = None
                         for path in learning_paths:
                             if path.get('id') == path_id:
@@ -519,10 +834,10 @@ def show_create_learning_path(user_id: str):
                             st.write(f"**Duration:** {created_path.get('duration_days', 0)} days")
                             st.write(f"**Type:** {created_path.get('type', 'normal').upper()}")
                             
-                            if st.button("📚 View Full Learning Path"):
-                                st.session_state.selected_path = created_path
-                                st.session_state.redirect_to = "📚 My Learning Paths"
-                                st.rerun()
+                            st.button(
+                                "📚 View Full Learning Path",
+                                on_click=_navigate_to, args=("📚 My Learning Paths", created_path)
+                            )
 
 def show_learning_paths(user_id: str):
     """Show user's learning paths"""
@@ -533,13 +848,14 @@ def show_learning_paths(user_id: str):
     </div>
     """, unsafe_allow_html=True)
     
-    learning_paths = learning_service.get_user_learning_paths(user_id)
+    learning_paths = _cached_user_paths(user_id)
     
     if not learning_paths:
         st.info("🚀 You haven't created any learning paths yet!")
-        if st.button("➕ Create Your First Learning Path", use_container_width=True):
-            st.session_state.redirect_to = "➕ Create Learning Path"
-            st.rerun()
+        st.button(
+            "➕ Create Your First Learning Path", use_container_width=True,
+            on_click=_navigate_to, args=("➕ Create Learning Path",)
+        )
         return
     
     # Filter and sort options
@@ -551,20 +867,21 @@ def show_learning_paths(user_id: str):
     with col3:
         sort_by = st.selectbox("Sort by", ["Recent", "Progress", "Duration"])
     
-    # Apply filters
-    filtered_paths = learning_paths.copy()
-    
-    if filter_type != "All":
-        filtered_paths = [p for p in filtered_paths if p.get('type', 'normal').upper() == filter_type.upper()]
-    
-    if filter_status == "In Progress":
-        filtered_paths = [p for p in filtered_paths if 0 < p.get('completion_percentage', 0) < 100]
-    elif filter_status == "Completed":
-        filtered_paths = [p for p in filtered_paths if p.get('completion_percentage', 0) >= 100]
+    # Apply filters in a single pass
+    filter_type_upper = filter_type.upper()
+    filtered_paths = [
+        p for p in learning_paths
+        if (filter_type == "All" or p.get('type', 'normal').upper() == filter_type_upper)
+        and _status_matches(p.get('completion_percentage', 0), filter_status)
+    ]
     
-    # Display learning paths
+    # Display learning paths, reading each field once per path
     for path in filtered_paths:
-        with st.expander(f"📖 {path.get('goal', 'Learning Path')} ({path.get('completion_percentage', 0):.1f}% complete)"):
+        path_id = path.get('id', '')
+        goal = path.get('goal', 'Learning Path')
+        completion = path.get('completion_percentage', 0)
+        
+        with st.expander(f"📖 {goal} ({completion:.1f}% complete)"):
             col1, col2 = st.columns([2, 1])
             
             with col1:
@@ -574,26 +891,38 @@ def show_learning_paths(user_id: str):
                 st.write(f"**Description:** {path.get('description', 'No description available')}")
                 
                 # Progress bar
-                completion = path.get('completion_percentage', 0)
                 st.markdown(create_progress_bar_html(completion), unsafe_allow_html=True)
             
             with col2:
-                if st.button(f"📖 View Details", key=f"view_{path.get('id', '')}"):
-                    show_learning_path_details(user_id, path)
+                st.button(
+                    f"📖 View Details", key=f"view_{path_id}",
+                    on_click=_open_path_view, args=("details", path_id)
+                )
                 
-                if st.button(f"🔔 Set Reminders", key=f"remind_{path.get('id', '')}"):
-                    show_notification_setup(user_id, path.get('id', ''))
+                st.button(
+                    f"🔔 Set Reminders", key=f"remind_{path_id}",
+                    on_click=_open_path_view, args=("reminders", path_id)
+                )
                 
-                if st.button(f"📄 Export", key=f"export_{path.get('id', '')}"):
-                    export_data = learning_service.export_learning_path(user_id, path.get('id', ''), 'json')
-                    if export_data:
+                # Payloads are only built on click, then reused until the paths change
+                if st.button(f"📄 Export", key=f"export_{path_id}"):
+                    payload = _cached_export(user_id, path_id, 'json', compress=True)
+                    if payload is not None:
                         st.download_button(
                             "📥 Download JSON",
-                            export_data,
-                            f"{path.get('goal', 'learning_path')}.json",
-                            "application/json"
+                            payload,
+                            f"{path.get('goal', 'learning_path')}.json.gz",
+                            "application/gzip"
                         )
 
+def _status_matches(completion: float, filter_status: str) -> bool:
+    """Check a path's completion against the status filter"""
+    if filter_status == "In Progress":
+        return 0 < completion < 100
+    if filter_status == "Completed":
+        return completion >= 100
+    return True
+
 def show_learning_path_details(user_id: str, path: dict):
     """Show detailed view of a learning path"""
     st.subheader(f"📖 {path.get('goal', 'Learning Path')}")
@@ -613,17 +942,89 @@ def show_learning_path_details(user_id: str, path: dict):
     # Daily plans
     st.subheader("📅 Daily Learning Plan")
     
-    daily_plans = path.get('daily_plans', [])
     progress = path.get('progress', {})
-    completed_days = progress.get('completed_days', {})
-    
-    # Calendar view toggle
-    view_mode = st.radio("View Mode", ["📋 List View", "📅 Calendar View"], horizontal=True)
+    _show_daily_plan_views(
+        user_id, path.get('id', ''), path.get('daily_plans', []),
+        progress.get('completed_days', {}), st.session_state.get('paths_version', 0)
+    )
+
+@st.fragment
+def _show_daily_plan_views(user_id: str, path_id: str, daily_plans: list,
+                           stored_completed_days: dict, stored_version: int):
+    """Render the list/calendar views; interactions here rerun only this fragment"""
+    # Overrides are merged inside the fragment so saves show up on its own reruns
+    completed_days = _with_progress_overrides(user_id, path_id, stored_completed_days, stored_version)
+    
+    # Calendar view toggle, remembered per path
+    view_mode = st.radio(
+        "View Mode", ["📋 List View", "📅 Calendar View"], horizontal=True, key=f"view_mode_{path_id}"
+    )
     
     if view_mode == "📅 Calendar View":
-        show_calendar_view(user_id, path.get('id', ''), daily_plans, completed_days)
+        show_calendar_view(user_id, path_id, daily_plans, completed_days)
     else:
-        show_list_view(user_id, path.get('id', ''), daily_plans, completed_days)
+        show_list_view(user_id, path_id, daily_plans, completed_days)
+
+def _scatter_render_mode(n_points: int) -> str:
+    """WebGL for long day series, SVG otherwise (plotly.express render_mode)"""
+    return 'webgl' if n_points > _WEBGL_DAY_THRESHOLD else 'svg'
+
+@st.cache_resource
+def _calendar_layout():
+    """Shared calendar layout; go.Figure copies it, so it is never mutated"""
+    import plotly.graph_objects as go
+    
+    return go.Layout(
+        title="Learning Progress Calendar",
+        showlegend=True,
+        legend_title_text='Status',
+        xaxis_title='Day',
+        yaxis=dict(visible=False),
+        height=200,
+        uirevision='calendar'
+    )
+
+@st.cache_data(show_spinner=False)
+def _calendar_figure(plans_key: tuple, completed_key: tuple):
+    """Build the progress calendar figure (cached on plan and completion state)"""
+    import plotly.graph_objects as go
+    
+    completed_days = dict(completed_key)
+    
+    # Marker area scales with objective count, as plotly.express sizes markers
+    max_objectives = max((objectives for _, _, objectives, _ in plans_key), default=0) or 1
+    sizeref = 2.0 * max_objectives / (20 ** 2)
+    
+    # Partition the days by completion in a single pass
+    rows_by_status = {'Completed': [], 'Pending': []}
+    for row in plans_key:
+        rows_by_status['Completed' if completed_days.get(row[0], False) else 'Pending'].append(row)
+    
+    # Long paths switch to WebGL markers instead of one SVG node per day
+    scatter = go.Scattergl if _scatter_render_mode(len(plans_key)) == 'webgl' else go.Scatter
+    
+    # Only the per-status data arrays change; the layout comes from the skeleton
+    fig = go.Figure(layout=_calendar_layout())
+    for status, color in (('Completed', '#4CAF50'), ('Pending', '#FF9800')):
+        rows = rows_by_status[status]
+        if not rows:
+            continue
+        fig.add_trace(scatter(
+            x=[day for day, _, _, _ in rows],
+            y=[1] * len(rows),
+            mode='markers',
+            name=status,
+            marker=dict(
+                color=color,
+                size=[objectives for _, _, objectives, _ in rows],
+                sizemode='area',
+                sizeref=sizeref
+            ),
+            customdata=[(title, estimated_time) for _, title, _, estimated_time in rows],
+            hovertemplate='Day %{x}<br>%{customdata[0]}<br>Estimated Time: %{customdata[1]}<extra></extra>'
+        ))
+    
+    return fig
 
 def show_calendar_view(user_id: str, path_id: str, daily_plans: list, completed_days: dict):
     """Show calendar view of learning progress"""
@@ -631,43 +1032,24 @@ def show_calendar_view(user_id: str, path_id: str, daily_plans: list, completed_
         st.info("No daily plans available")
         return
     
-    # Create calendar data
-    calendar_data = []
-    for plan in daily_plans:
-        day = plan.get('day', 1)
-        completed = completed_days.get(str(day), False)
-        
-        calendar_data.append({
-            'Day': day,
-            'Title': plan.get('title', f'Day {day}'),
-            'Status': 'Completed' if completed else 'Pending',
-            'Objectives': len(plan.get('objectives', [])),
-            'Estimated Time': plan.get('estimated_time', 'Unknown')
-        })
-    
-    # Display as interactive calendar
-    df = pd.DataFrame(calendar_data)
-    
-    # Create calendar visualization
-    fig = px.scatter(
-        df, 
-        x='Day', 
-        y=[1] * len(df),
-        color='Status',
-        size='Objectives',
-        hover_data=['Title', 'Estimated Time'],
-        color_discrete_map={'Completed': '#4CAF50', 'Pending': '#FF9800'},
-        title="Learning Progress Calendar"
+    # Hashable snapshot of what the figure depends on, so changing the
+    # selected day below reuses the cached figure
+    plans_key = tuple(
+        (
+            plan.get('day', 1),
+            plan.get('title', f"Day {plan.get('day', 1)}"),
+            len(plan.get('objectives', [])),
+            plan.get('estimated_time', 'Unknown')
+        )
+        for plan in daily_plans
     )
+    completed_key = tuple(sorted((int(day), bool(done)) for day, done in completed_days.items()))
     
-    fig.update_layout(
-        showlegend=True,
-        yaxis=dict(visible=False),
-        height=200
+    st.plotly_chart(
+        _calendar_figure(plans_key, completed_key),
+        use_container_width=True, key=f"calendar_{path_id}"
     )
     
-    st.plotly_chart(fig, use_container_width=True)
-    
     # Interactive day selection
     selected_day = st.selectbox("Select Day to View Details", range(1, len(daily_plans) + 1))
     
@@ -675,8 +1057,110 @@ def show_calendar_view(user_id: str, path_id: str, daily_plans: list, completed_
         plan = daily_plans[selected_day - 1]
         show_daily_plan_details(user_id, path_id, plan, completed_days)
 
+def _save_progress_form(user_id: str, path_id: str, completed_key: tuple, editor_key: str):
+    """Persist the days changed in a progress form in one background write"""
+    # The editor state only lists edited rows, so untouched days cost nothing
+    day_updates = {}
+    for row, changes in st.session_state[editor_key].get('edited_rows', {}).items():
+        day, was_completed = completed_key[int(row)]
+        completed = changes.get('Completed', was_completed)
+        if completed != was_completed:
+            day_updates[day] = completed
+    if not day_updates:
+        return
+    
+    # Settle finished writes first so the pending list only holds writes in flight
+    _resolve_progress_writes()
+    
+    # Show the new state right away. Each override carries the number of the
+    # write that set it, so only that write may clear it once it settles
+    seq = st.session_state.get('progress_write_seq', 0) + 1
+    st.session_state.progress_write_seq = seq
+    overrides = st.session_state.setdefault('progress_overrides', {})
+    for day, completed in day_updates.items():
+        overrides[(path_id, str(day))] = (seq, completed)
+    
+    # Only the Streamlit-free write runs off the script thread; failures are
+    # reported when the write is settled in _resolve_progress_writes
+    future = _progress_write_executor.submit(
+        learning_service.write_daily_progress_batch, user_id, path_id, day_updates
+    )
+    st.session_state.setdefault('pending_progress_writes', []).append((path_id, tuple(day_updates), seq, future))
+
+def _resolve_progress_writes():
+    """Settle finished background progress writes and drop the overrides they own
+
+    A successful write's overrides are no longer needed once the caches are
+    cleared; a failed write's are rolled back. Days edited again by a newer
+    write keep that write's override either way.
+    """
+    overrides = st.session_state.get('progress_overrides', {})
+    pending = []
+    for path_id, days, seq, future in st.session_state.get('pending_progress_writes', []):
+        if not future.done():
+            pending.append((path_id, days, seq, future))
+            continue
+        
+        error = future.exception()
+        for day in days:
+            key = (path_id, str(day))
+            if overrides.get(key, (None,))[0] == seq:
+                del overrides[key]
+        if error is None:
+            _clear_path_caches()
+        else:
+            st.toast(f"❌ Failed to save progress for day(s) {', '.join(map(str, days))}: {str(error)}")
+    st.session_state.pending_progress_writes = pending
+
+def _with_progress_overrides(user_id: str, path_id: str, completed_days: dict, stored_version: int) -> dict:
+    """Merge locally recorded progress toggles over the stored completed days"""
+    _resolve_progress_writes()
+    
+    # Fragment reruns keep the arguments of the last full run; once a write has
+    # landed since then, read the stored progress again (cached per version)
+    if st.session_state.get('paths_version', 0) != stored_version:
+        path = _cached_user_path(user_id, path_id)
+        if path:
+            completed_days = path.get('progress', {}).get('completed_days', {})
+    
+    merged = dict(completed_days)
+    for (override_path_id, day_str), (_, completed) in st.session_state.get('progress_overrides', {}).items():
+        if override_path_id == path_id:
+            merged[day_str] = completed
+    return merged
+
 def show_list_view(user_id: str, path_id: str, daily_plans: list, completed_days: dict):
     """Show list view of daily plans"""
+    import pandas as pd
+    
+    # Progress toggles live in one data editor inside a form, so flipping
+    # several days is a single widget, a single rerun and a single write
+    completed_key = tuple(
+        (plan.get('day', 1), completed_days.get(str(plan.get('day', 1)), False))
+        for plan in daily_plans
+    )
+    if completed_key:
+        # Keyed on the saved state so stale edits reset once it changes
+        editor_key = f"progress_grid_{path_id}_{hash(completed_key)}"
+        with st.form(f"progress_{path_id}"):
+            st.markdown("**✅ Mark completed days**")
+            st.data_editor(
+                pd.DataFrame({
+                    'Day': [day for day, _ in completed_key],
+                    'Title': [plan.get('title', 'Learning Day') for plan in daily_plans],
+                    'Completed': [completed for _, completed in completed_key]
+                }),
+                key=editor_key,
+                disabled=['Day', 'Title'],
+                hide_index=True,
+                use_container_width=True
+            )
+            st.form_submit_button(
+                "💾 Save Progress",
+                on_click=_save_progress_form,
+                args=(user_id, path_id, completed_key, editor_key)
+            )
+    
     for plan in daily_plans:
         day = plan.get('day', 1)
         completed = completed_days.get(str(day), False)
@@ -688,26 +1172,16 @@ def show_list_view(user_id: str, path_id: str, daily_plans: list, completed_days
             col1, col2 = st.columns([4, 1])
             
             with col1:
-                st.markdown(f"""
-                <div class="{card_class}">
-                    <h4>Day {day}: {plan.get('title', 'Learning Day')}</h4>
-                    <p><strong>Estimated Time:</strong> {plan.get('estimated_time', 'Unknown')}</p>
-                    <p><strong>Objectives:</strong> {len(plan.get('objectives', []))} learning objectives</p>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(_DAY_CARD_TPL.substitute(
+                    card_class=card_class,
+                    day=day,
+                    title=plan.get('title', 'Learning Day'),
+                    estimated_time=plan.get('estimated_time', 'Unknown'),
+                    objective_count=len(plan.get('objectives', []))
+                ), unsafe_allow_html=True)
             
             with col2:
-                # Toggle completion
-                new_status = st.checkbox(
-                    "✅ Completed" if completed else "⏳ Mark Complete",
-                    value=completed,
-                    key=f"day_{day}_{path_id}"
-                )
-                
-                if new_status != completed:
-                    success = learning_service.update_daily_progress(user_id, path_id, day, new_status)
-                    if success:
-                        st.rerun()
+                st.write("✅ Completed" if completed else "⏳ Pending")
                 
                 # View details button
                 if st.button(f"👁️ Details", key=f"details_{day}_{path_id}"):
@@ -754,32 +1228,41 @@ def show_daily_plan_details(user_id: str, path_id: str, plan: dict, completed_da
     st.write(content)
     
     # Multimedia content
-    if plan.get('recommended_videos'):
+    videos = plan.get('recommended_videos')
+    if videos:
         st.subheader("🎥 Recommended Videos")
-        videos = plan.get('recommended_videos', [])
         
         cols = st.columns(min(3, len(videos)))
         for i, video in enumerate(videos[:3]):
             with cols[i]:
-                st.markdown(f"""
-                <div class="feature-card">
-                    <h5>{video.get('title', 'Video')}</h5>
-                    <p>{video.get('channel', 'Unknown Channel')}</p>
-                    <a href="{video.get('url', '#')}" target="_blank">🎥 Watch Video</a>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(_video_card_html(
+                    video.get('title', 'Video'),
+                    video.get('channel', 'Unknown Channel'),
+                    video.get('url', '#')
+                ), unsafe_allow_html=True)
     
     # Audio content
     if plan.get('audio_available'):
         st.subheader("🎧 Audio Content")
         st.info(f"🔊 Audio version available (Duration: {plan.get('audio_duration', '5m')})")
         
+        audio_key = f"audio_future_{path_id}_{day}"
+        
         if st.button("🎵 Generate Audio", key=f"audio_{day}"):
-            with st.spinner("Generating audio..."):
-                audio_data = elevenlabs_client.create_audio_for_daily_plan(plan)
+            st.session_state[audio_key] = _start_plan_audio(path_id, day, plan)
+        
+        job_key = st.session_state.get(audio_key)
+        audio_future = _get_plan_audio(job_key) if job_key is not None else None
+        if audio_future is not None:
+            if not audio_future.done():
+                _await_plan_audio(job_key)
+            elif audio_future.exception() is not None:
+                st.error(f"Failed to create daily plan audio: {str(audio_future.exception())}")
+            else:
+                audio_data = audio_future.result()
                 if audio_data:
                     st.success("Audio generated successfully!")
-                    # In a real implementation, you'd provide audio playback here
+                    st.audio(audio_data, format=elevenlabs_client.audio_format)
 
 def show_analytics(user_id: str):
     """Show analytics dashboard"""
@@ -791,8 +1274,8 @@ def show_analytics(user_id: str):
     """, unsafe_allow_html=True)
     
     # Get analytics data
-    analytics = learning_service.get_learning_analytics(user_id)
-    learning_paths = learning_service.get_user_learning_paths(user_id)
+    learning_paths = _cached_user_paths(user_id)
+    analytics = _cached_path_summary(user_id)
     
     if not learning_paths:
         st.info("📈 Start learning to see your analytics!")
@@ -813,84 +1296,130 @@ def show_analytics(user_id: str):
     # Progress over time
     st.subheader("📈 Progress Over Time")
     
-    # Create progress data
-    progress_data = []
+    # Collect completed day numbers and the per-path breakdown columns in one pass
+    completed_day_numbers = []
+    goals, progress_values, types, difficulties = [], [], [], []
     for path in learning_paths:
+        goals.append(path.get('goal', 'Unknown'))
+        progress_values.append(path.get('completion_percentage', 0))
+        types.append(path.get('type', 'normal').upper())
+        difficulties.append(path.get('difficulty', 'unknown').title())
+        
         progress = path.get('progress', {})
         completed_days = progress.get('completed_days', {})
         
-        for day_str, completed in completed_days.items():
-            if completed:
-                progress_data.append({
-                    'Date': datetime.now() - timedelta(days=int(day_str)),
-                    'Path': path.get('goal', 'Unknown'),
-                    'Day': int(day_str),
-                    'Completed': 1
-                })
-    
-    if progress_data:
-        df = pd.DataFrame(progress_data)
-        df['Date'] = pd.to_datetime(df['Date'])
-        
-        # Daily completion chart
-        daily_completion = df.groupby('Date')['Completed'].sum().reset_index()
-        
-        fig = px.line(
-            daily_completion, 
-            x='Date', 
-            y='Completed',
-            title='Daily Learning Activity',
-            labels={'Completed': 'Days Completed', 'Date': 'Date'}
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        completed_day_numbers.extend(int(day_str) for day_str, completed in completed_days.items() if completed)
+    
+    if completed_day_numbers:
+        # Daily completion chart, rebuilt only when completed days change
+        fig = _build_activity_fig(tuple(sorted(completed_day_numbers)))
+        st.plotly_chart(fig, use_container_width=True, key="daily_activity")
         
         # Learning path breakdown
         st.subheader("📚 Learning Path Breakdown")
         
-        path_data = []
-        for path in learning_paths:
-            path_data.append({
-                'Goal': path.get('goal', 'Unknown'),
-                'Progress': path.get('completion_percentage', 0),
-                'Type': path.get('type', 'normal').upper(),
-                'Difficulty': path.get('difficulty', 'unknown').title()
-            })
-        
-        df_paths = pd.DataFrame(path_data)
-        
-        # Progress by path
-        fig = px.bar(
-            df_paths,
-            x='Goal',
-            y='Progress',
-            color='Type',
-            title='Progress by Learning Path',
-            labels={'Progress': 'Completion %'}
-        )
+        path_data = {
+            'Goal': goals,
+            'Progress': progress_values,
+            'Type': types,
+            'Difficulty': difficulties
+        }
         
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Difficulty distribution
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            difficulty_counts = df_paths['Difficulty'].value_counts()
-            fig = px.pie(
-                values=difficulty_counts.values,
-                names=difficulty_counts.index,
-                title='Learning Paths by Difficulty'
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            type_counts = df_paths['Type'].value_counts()
-            fig = px.pie(
-                values=type_counts.values,
-                names=type_counts.index,
-                title='Learning Paths by Type'
-            )
-            st.plotly_chart(fig, use_container_width=True)
+        _render_path_analytics(path_data)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _build_activity_fig(completed_day_numbers: tuple):
+    """Build the daily learning activity line chart from completed day numbers"""
+    import pandas as pd
+    import plotly.express as px
+    
+    # Count days once, then map day offsets to dates in a single vectorized step
+    counts = pd.Series(completed_day_numbers).value_counts()
+    daily_completion = pd.DataFrame({
+        'Date': pd.Timestamp.now().normalize() - pd.to_timedelta(counts.index, unit='D'),
+        'Completed': counts.to_numpy()
+    }).sort_values('Date')
+    
+    # A constant uirevision keeps zoom/pan when the data behind the chart changes
+    return px.line(
+        daily_completion, 
+        x='Date', 
+        y='Completed',
+        title='Daily Learning Activity',
+        labels={'Completed': 'Days Completed', 'Date': 'Date'},
+        render_mode=_scatter_render_mode(len(daily_completion))
+    ).update_layout(uirevision='daily_activity')
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _build_progress_fig(goals: tuple, progress_values: tuple, types: tuple):
+    """Build the progress-by-path bar chart from parallel goal/progress/type columns"""
+    import plotly.graph_objects as go
+    
+    # Large charts switch to WebGL markers instead of one SVG node per bar
+    use_webgl = len(goals) > _WEBGL_PATH_THRESHOLD
+    
+    # Group goals and progress by type in one pass (insertion order keeps the express color order)
+    columns_by_type = {}
+    for goal, progress, path_type in zip(goals, progress_values, types):
+        x, y = columns_by_type.setdefault(path_type, ([], []))
+        x.append(goal)
+        y.append(progress)
+    
+    # One trace per type, matching the express color grouping
+    fig = go.Figure()
+    for path_type, (x, y) in columns_by_type.items():
+        if use_webgl:
+            fig.add_trace(go.Scattergl(
+                x=x, y=y, name=path_type, mode='markers',
+                hovertemplate='%{x}: %{y:.1f}%<extra></extra>'
+            ))
+        else:
+            fig.add_trace(go.Bar(x=x, y=y, name=path_type))
+    fig.update_layout(
+        title='Progress by Learning Path',
+        xaxis_title='Goal',
+        yaxis_title='Completion %',
+        legend_title_text='Type',
+        uirevision='progress_by_path'
+    )
+    return fig
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _build_distribution_fig(difficulties: tuple, types: tuple):
+    """Build side-by-side pie charts of paths by difficulty and by type"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    
+    fig = make_subplots(
+        rows=1, cols=2,
+        specs=[[{"type": "domain"}, {"type": "domain"}]],
+        subplot_titles=('Learning Paths by Difficulty', 'Learning Paths by Type')
+    )
+    for col, (values, categories) in enumerate(
+        ((difficulties, _DIFFICULTY_CATEGORIES), (types, _TYPE_CATEGORIES)), start=1
+    ):
+        # A handful of distinct values: a Counter beats building a Series.
+        # Known categories keep their order; unexpected values follow
+        counts = Counter(values)
+        labels = [label for label in dict.fromkeys(categories + values) if counts[label]]
+        fig.add_trace(go.Pie(values=[counts[label] for label in labels], labels=labels), row=1, col=col)
+    # Keeps legend toggles across reruns
+    fig.update_layout(uirevision='path_distributions')
+    return fig
+
+@st.fragment
+def _render_path_analytics(path_data: dict):
+    """Render the per-path progress and distribution charts"""
+    # Columns go to the cached builders as-is, without zipping back into rows
+    types = tuple(path_data['Type'])
+    
+    # Progress by path
+    fig = _build_progress_fig(tuple(path_data['Goal']), tuple(path_data['Progress']), types)
+    st.plotly_chart(fig, use_container_width=True, key="progress_by_path")
+    
+    # Difficulty and type distributions share one figure
+    fig = _build_distribution_fig(tuple(path_data['Difficulty']), types)
+    st.plotly_chart(fig, use_container_width=True, key="path_distributions")
 
 def show_notifications(user_id: str):
     """Show notifications management"""
@@ -901,35 +1430,54 @@ def show_notifications(user_id: str):
     </div>
     """, unsafe_allow_html=True)
     
-    tab1, tab2, tab3 = st.tabs(["⚙️ Setup Reminders", "📱 Test Notifications", "📋 History"])
+    # Only the selected section is rendered (st.tabs would run all three)
+    active_tab = st.radio(
+        "Section",
+        ["⚙️ Setup Reminders", "📱 Test Notifications", "📋 History"],
+        horizontal=True,
+        label_visibility="collapsed",
+        key="notif_active_tab"
+    )
     
-    with tab1:
+    if active_tab == "⚙️ Setup Reminders":
         show_notification_setup(user_id)
-    
-    with tab2:
+    elif active_tab == "📱 Test Notifications":
         show_notification_test()
-    
-    with tab3:
+    else:
         show_notification_history(user_id)
 
+def _reminder_signature(reminder_settings: dict) -> int:
+    """Hash the reminder form payload to detect unchanged resubmits"""
+    return hash((
+        reminder_settings['phone_number'],
+        reminder_settings['method'],
+        reminder_settings['time'],
+        reminder_settings['days_mask']
+    ))
+
+@st.fragment
 def show_notification_setup(user_id: str, path_id: str = None):
     """Show notification setup"""
     st.subheader("⚙️ Setup Learning Reminders")
     
-    # Get user's learning paths
-    learning_paths = learning_service.get_user_learning_paths(user_id)
-    
-    if not learning_paths:
-        st.info("Create a learning path first to set up reminders!")
-        return
+    # A preselected path only needs its own record; otherwise the cached
+    # goal -> id options serve as both the guard and the selector
+    if path_id:
+        selected_path = _cached_user_path(user_id, path_id)
+        if not selected_path:
+            st.error("Learning path not found")
+            return
+    else:
+        path_options = _cached_path_options(user_id)
+        if not path_options:
+            st.info("Create a learning path first to set up reminders!")
+            return
     
     with st.form("notification_setup"):
         # Select learning path
         if path_id:
-            selected_path = next((p for p in learning_paths if p.get('id') == path_id), None)
-            st.info(f"Setting up reminders for: {selected_path.get('goal', 'Unknown') if selected_path else 'Unknown'}")
+            st.info(f"Setting up reminders for: {selected_path.get('goal', 'Unknown')}")
         else:
-            path_options = {p.get('goal', f"Path {i}"): p.get('id', '') for i, p in enumerate(learning_paths)}
             selected_goal = st.selectbox("Select Learning Path", list(path_options.keys()))
             path_id = path_options.get(selected_goal, '')
         
@@ -945,20 +1493,20 @@ def show_notification_setup(user_id: str, path_id: str = None):
             notification_method = st.selectbox(
                 "Notification Method",
                 ["sms", "whatsapp", "voice"],
-                format_func=lambda x: {"sms": "📱 SMS", "whatsapp": "💬 WhatsApp", "voice": "📞 Voice Call"}[x]
+                format_func=_NOTIF_METHOD_LABELS.__getitem__
             )
         
         with col2:
             reminder_time = st.time_input(
                 "Reminder Time",
-                value=datetime.strptime("09:00", "%H:%M").time(),
+                value=_DEFAULT_REMINDER_TIME,
                 help="When should we send daily reminders?"
             )
             
             days_to_remind = st.multiselect(
                 "Days to Send Reminders",
-                ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"],
-                default=["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
+                _WEEKDAYS,
+                default=_WEEKDAYS[:5]
             )
         
         if st.form_submit_button("🔔 Setup Reminders", use_container_width=True):
@@ -973,14 +1521,22 @@ def show_notification_setup(user_id: str, path_id: str = None):
                     'phone_number': phone_number,
                     'method': notification_method,
                     'time': reminder_time.strftime("%H:%M"),
-                    'days': [i for i, day in enumerate(["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]) if day in days_to_remind]
+                    # Bit i set means remind on weekday i (Monday = 0)
+                    'days_mask': sum(1 << _DAY_INDEX[day] for day in days_to_remind)
                 }
                 
-                success = notification_service.schedule_learning_reminder(user_id, path_id, reminder_settings)
-                if success:
+                # Skip resubmits identical to what is already saved for this path
+                signature = _reminder_signature(reminder_settings)
+                saved_sigs = st.session_state.setdefault('saved_reminder_sigs', {})
+                if saved_sigs.get(path_id) == signature:
+                    st.toast("✅ These reminders are already set up")
+                elif notification_service.schedule_learning_reminder(user_id, path_id, reminder_settings):
+                    saved_sigs[path_id] = signature
+                    _cached_history.clear()
                     st.success("🎉 Reminders set up successfully!")
-                    st.balloons()
+                    _celebrate_once("reminders_ever_set")
 
+@st.fragment
 def show_notification_test():
     """Show notification testing"""
     st.subheader("📱 Test Your Notifications")
@@ -999,7 +1555,7 @@ def show_notification_test():
             test_method = st.selectbox(
                 "Test Method",
                 ["sms", "whatsapp", "voice"],
-                format_func=lambda x: {"sms": "📱 SMS", "whatsapp": "💬 WhatsApp", "voice": "📞 Voice Call"}[x]
+                format_func=_NOTIF_METHOD_LABELS.__getitem__
             )
         
         if st.form_submit_button("🧪 Send Test Notification", use_container_width=True):
@@ -1011,34 +1567,45 @@ def show_notification_test():
                 with st.spinner("Sending test notification..."):
                     success = notification_service.test_notification(test_phone, test_method)
                     if success:
+                        _cached_history.clear()
                         st.success("✅ Test notification sent successfully!")
                     else:
                         st.error("❌ Failed to send test notification")
 
 def show_notification_history(user_id: str):
     """Show notification history"""
+    import pandas as pd
+    
     st.subheader("📋 Notification History")
     
-    history = notification_service.get_notification_history(user_id)
+    history = _cached_history(user_id)
     
     if not history:
         st.info("No notification history available yet.")
         return
     
+    # One reference time for the whole table, also used for missing timestamps
+    now = datetime.now(timezone.utc)
+    
+    # Collect raw columns in one pass, then format each column vectorized
+    types, goals, methods, sent_times = [], [], [], []
     for notification in history:
-        with st.container():
-            col1, col2, col3 = st.columns([2, 1, 1])
-            
-            with col1:
-                st.write(f"**{notification.get('type', 'Unknown').title()}** - {notification.get('path_goal', 'Unknown Path')}")
-            
-            with col2:
-                method_icon = {"sms": "📱", "whatsapp": "💬", "voice": "📞"}.get(notification.get('method', ''), "📧")
-                st.write(f"{method_icon} {notification.get('method', 'Unknown').upper()}")
-            
-            with col3:
-                sent_at = notification.get('sent_at', datetime.now())
-                st.write(format_date_relative(sent_at))
+        types.append(notification.get('type', 'Unknown'))
+        goals.append(notification.get('path_goal', 'Unknown Path'))
+        methods.append(notification.get('method', 'Unknown'))
+        sent_times.append(notification.get('sent_at', now))
+    
+    methods = pd.Series(methods)
+    history_df = pd.DataFrame({
+        'Type': pd.Series(types).str.title(),
+        'Path': goals,
+        'Method': methods.map(_NOTIF_METHOD_ICONS).fillna("📧") + " " + methods.str.upper(),
+        'Sent': pd.Series(sent_times, dtype=object).map(
+            partial(format_date_relative, now=now)
+        )
+    })
+    
+    st.dataframe(history_df, hide_index=True, use_container_width=True)
 
 def show_settings(user_id: str):
     """Show settings page"""
@@ -1049,17 +1616,23 @@ def show_settings(user_id: str):
     </div>
     """, unsafe_allow_html=True)
     
-    tab1, tab2, tab3 = st.tabs(["👤 Profile", "🔧 Preferences", "🔗 Integrations"])
+    # Only the selected section is rendered (st.tabs would run all three)
+    active_tab = st.radio(
+        "Section",
+        ["👤 Profile", "🔧 Preferences", "🔗 Integrations"],
+        horizontal=True,
+        label_visibility="collapsed",
+        key="settings_active_tab"
+    )
     
-    with tab1:
+    if active_tab == "👤 Profile":
         show_profile_settings(user_id)
-    
-    with tab2:
+    elif active_tab == "🔧 Preferences":
         show_preference_settings(user_id)
-    
-    with tab3:
+    else:
         show_integration_settings()
 
+@st.fragment
 def show_profile_settings(user_id: str):
     """Show profile settings"""
     st.subheader("👤 Profile Settings")
@@ -1105,6 +1678,7 @@ def show_profile_settings(user_id: str):
             # In a real implementation, you'd save these settings
             st.success("Profile updated successfully!")
 
+@st.fragment
 def show_preference_settings(user_id: str):
     """Show preference settings"""
     st.subheader("🔧 Preferences")
@@ -1149,34 +1723,87 @@ def show_preference_settings(user_id: str):
         if st.form_submit_button("💾 Save Preferences", use_container_width=True):
             st.success("Preferences saved successfully!")
 
-def show_integration_settings():
-    """Show integration settings"""
-    st.subheader("🔗 Integration Status")
-    
-    # API status indicators
-    integrations = [
+@st.cache_resource
+def _get_integrations() -> tuple:
+    """Integration status rows with display labels; settings don't change within a process"""
+    rows = (
         ("🤖 Google Gemini AI", settings.GEMINI_API_KEY != "demo_key", "AI-powered learning path generation"),
         ("🎥 YouTube API", settings.YOUTUBE_API_KEY != "demo_key", "Curated video recommendations"),
         ("🔊 ElevenLabs TTS", settings.ELEVENLABS_API_KEY != "demo_key", "Text-to-speech audio generation"),
         ("📱 Twilio SMS/Voice", settings.TWILIO_ACCOUNT_SID != "demo_sid", "SMS, WhatsApp, and voice reminders"),
         ("☁️ Firebase", not settings.is_demo_mode, "User authentication and data storage"),
         ("📄 Google Drive", settings.GOOGLE_CLIENT_ID != "demo_client_id", "Document creation and storage")
-    ]
+    )
+    return tuple(
+        (name, "✅ Active" if active else "🔧 Demo Mode", description)
+        for name, active, description in rows
+    )
+
+# Base URLs used to check that each external API is reachable
+_API_PROBE_URLS = {
+    "🤖 Google Gemini AI": "https://generativelanguage.googleapis.com",
+    "🎥 YouTube API": "https://www.googleapis.com/youtube/v3",
+    "🔊 ElevenLabs TTS": "https://api.elevenlabs.io/v1",
+    "📱 Twilio SMS/Voice": "https://api.twilio.com"
+}
+
+def _probe_api(url: str) -> bool:
+    """Check whether an API endpoint answers without a server error
+
+    Probes are unauthenticated, so 4xx answers (e.g. 401/404 on the base
+    URL) still count as reachable; this does not validate API keys.
+    """
+    try:
+        return requests.head(url, timeout=1.5).status_code < 500
+    except requests.RequestException:
+        return False
+
+async def _probe_all_apis() -> list:
+    """Probe every API concurrently so the wait is the slowest probe, not the sum"""
+    return await asyncio.gather(
+        *(asyncio.to_thread(_probe_api, url) for url in _API_PROBE_URLS.values())
+    )
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _get_api_reachability() -> dict:
+    """Map each probed integration name to whether its API is reachable"""
+    return dict(zip(_API_PROBE_URLS, asyncio.run(_probe_all_apis())))
+
+def _refresh_api_status():
+    """Drop cached probe results so the next render checks the APIs again"""
+    _get_api_reachability.clear()
+    st.session_state.api_status_checked = True
+
+@st.fragment
+def show_integration_settings():
+    """Show integration settings"""
+    import pandas as pd
     
-    for name, is_configured, description in integrations:
-        col1, col2, col3 = st.columns([2, 1, 3])
-        
-        with col1:
-            st.write(f"**{name}**")
-        
-        with col2:
-            if is_configured:
-                st.success("✅ Active")
-            else:
-                st.warning("🔧 Demo Mode")
-        
-        with col3:
-            st.write(description)
+    st.subheader("🔗 Integration Status")
+    
+    # API status indicators
+    integrations_df = pd.DataFrame(_get_integrations(), columns=['Integration', 'Status', 'Description'])
+    
+    st.button("🔄 Refresh API Status", on_click=_refresh_api_status)
+    
+    if st.session_state.get('api_status_checked'):
+        with st.spinner("Checking API status..."):
+            reachability = _get_api_reachability()
+        integrations_df['Reachable'] = integrations_df['Integration'].map(
+            lambda name: {True: "🟢 Yes", False: "🔴 No"}.get(reachability.get(name), "—")
+        )
+        st.caption("Reachable means the API answered without a server error; API keys are not checked.")
+    
+    st.dataframe(
+        integrations_df,
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            'Integration': st.column_config.TextColumn(width="medium"),
+            'Status': st.column_config.TextColumn(width="small"),
+            'Description': st.column_config.TextColumn(width="large")
+        }
+    )
     
     if settings.is_demo_mode:
         st.info("""
@@ -1,5 +1,6 @@
 import streamlit as st
 import hashlib
+import hmac
 import secrets
 import json
 import os
@@ -9,10 +10,18 @@ from firebase_admin import auth as firebase_auth_admin
 from config.firebase_config import firebase_config
 from database.firestore_client import firestore_client
 
+# Password hashing work factor; the iteration count is stored with each hash
+_PBKDF2_PREFIX = "pbkdf2_sha256"
+_PBKDF2_ITERATIONS = 200_000
+
 class FirebaseAuth:
     def __init__(self):
         self.demo_users_file = "demo_users.json"
         self.ensure_demo_users_file()
+        
+        # Demo users are kept in memory and reloaded only if the file changes
+        self._demo_users = {}
+        self._demo_users_mtime = None
 
     def ensure_demo_users_file(self):
         """Ensure demo users file exists"""
@@ -29,17 +38,41 @@ class FirebaseAuth:
             with open(self.demo_users_file, 'w') as f:
                 json.dump(demo_users, f, indent=2)
 
+    def _load_demo_users(self) -> Dict[str, Any]:
+        """Get demo users, re-reading the file only when it has been modified"""
+        mtime = os.path.getmtime(self.demo_users_file)
+        if mtime != self._demo_users_mtime:
+            with open(self.demo_users_file, 'r') as f:
+                self._demo_users = json.load(f)
+            self._demo_users_mtime = mtime
+        return self._demo_users
+
+    def _save_demo_users(self, users: Dict[str, Any]):
+        """Write demo users to the file and keep the in-memory copy in sync"""
+        with open(self.demo_users_file, 'w') as f:
+            json.dump(users, f, indent=2)
+        self._demo_users = users
+        self._demo_users_mtime = os.path.getmtime(self.demo_users_file)
+
     def hash_password(self, password: str) -> str:
-        """Hash password with salt"""
-        salt = secrets.token_hex(16)
-        password_hash = hashlib.sha256((password + salt).encode()).hexdigest()
-        return f"{salt}:{password_hash}"
+        """Hash password with salt using PBKDF2-HMAC-SHA256"""
+        salt = secrets.token_bytes(16)
+        derived_key = hashlib.pbkdf2_hmac('sha256', password.encode(), salt, _PBKDF2_ITERATIONS)
+        return f"{_PBKDF2_PREFIX}${_PBKDF2_ITERATIONS}${salt.hex()}${derived_key.hex()}"
 
     def verify_password(self, password: str, hashed: str) -> bool:
-        """Verify password against hash"""
+        """Verify password against hash (PBKDF2, or legacy salted SHA-256)"""
         try:
-            salt, password_hash = hashed.split(':')
-            return hashlib.sha256((password + salt).encode()).hexdigest() == password_hash
+            if hashed.startswith(_PBKDF2_PREFIX + '$'):
+                _, iterations, salt, password_hash = hashed.split('$')
+                derived_key = hashlib.pbkdf2_hmac('sha256', password.encode(), bytes.fromhex(salt), int(iterations))
+                return hmac.compare_digest(derived_key.hex(), password_hash)
+            
+            # Hashes stored before the switch to PBKDF2
+            salt, sep, password_hash = hashed.partition(':')
+            if not sep:
+                return False
+            return hmac.compare_digest(hashlib.sha256((password + salt).encode()).hexdigest(), password_hash)
         except ValueError:
             return False
 
@@ -77,9 +110,9 @@ class FirebaseAuth:
                     'role': 'student'
                 }
             else:
-                # Demo mode - local storage
-                with open(self.demo_users_file, 'r') as f:
-                    users = json.load(f)
+                # Demo mode - local storage (copied, so a failed write leaves
+                # the in-memory users untouched)
+                users = dict(self._load_demo_users())
                 
                 if email in users:
                     return None  # User already exists
@@ -93,8 +126,7 @@ class FirebaseAuth:
                     "user_id": user_id
                 }
                 
-                with open(self.demo_users_file, 'w') as f:
-                    json.dump(users, f, indent=2)
+                self._save_demo_users(users)
                 
                 return {
                     'user_id': user_id,
@@ -124,11 +156,8 @@ class FirebaseAuth:
                 return None
             else:
                 # Demo mode
-                with open(self.demo_users_file, 'r') as f:
-                    users = json.load(f)
-                
-                if email in users:
-                    user = users[email]
+                user = self._load_demo_users().get(email)
+                if user:
                     if self.verify_password(password, user['password_hash']):
                         return {
                             'user_id': user['user_id'],
@@ -1,3 +1,4 @@
+import threading
 import firebase_admin
 from firebase_admin import credentials, auth, firestore
 from config.settings import settings
@@ -7,6 +8,7 @@ class FirebaseConfig:
     _instance = None
     _app = None
     _db = None
+    _lock = threading.Lock()
 
     def __new__(cls):
         if cls._instance is None:
@@ -15,26 +17,37 @@ class FirebaseConfig:
 
     def initialize_firebase(self):
         """Initialize Firebase app and services"""
+        # Fast path: the client is created once per process
+        if self._db is not None:
+            return True
         try:
-            if not firebase_admin._apps:
-                # Check if we have valid Firebase configuration
-                if all(value for value in settings.FIREBASE_CONFIG.values()):
-                    cred = credentials.Certificate(settings.FIREBASE_CONFIG)
-                    self._app = firebase_admin.initialize_app(cred)
-                    self._db = firestore.client()
+            with self._lock:
+                # Another session may have finished initializing while we waited
+                if self._db is not None:
                     return True
-                else:
-                    # Demo mode - Firebase not configured
-                    st.warning("Firebase not configured. Running in demo mode.")
-                    return False
-            else:
-                self._app = firebase_admin.get_app()
-                self._db = firestore.client()
-                return True
+                return self._initialize_locked()
         except Exception as e:
             st.error(f"Firebase initialization failed: {str(e)}")
             return False
 
+    def _initialize_locked(self) -> bool:
+        """Create the Firebase app and Firestore client; caller holds the lock"""
+        if not firebase_admin._apps:
+            # Check if we have valid Firebase configuration
+            if all(value for value in settings.FIREBASE_CONFIG.values()):
+                cred = credentials.Certificate(dict(settings.FIREBASE_CONFIG))
+                self._app = firebase_admin.initialize_app(cred)
+                self._db = firestore.client()
+                return True
+            else:
+                # Demo mode - Firebase not configured
+                st.warning("Firebase not configured. Running in demo mode.")
+                return False
+        else:
+            self._app = firebase_admin.get_app()
+            self._db = firestore.client()
+            return True
+
     @property
     def db(self):
         """Get Firestore database instance"""
@@ -1,12 +1,13 @@
 import os
+from types import MappingProxyType
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
 class Settings:
-    # Firebase Configuration
-    FIREBASE_CONFIG = {
+    # Firebase Configuration (read-only)
+    FIREBASE_CONFIG = MappingProxyType({
         "type": os.getenv("FIREBASE_TYPE"),
         "project_id": os.getenv("FIREBASE_PROJECT_ID"),
         "private_key_id": os.getenv("FIREBASE_PRIVATE_KEY_ID"),
@@ -17,7 +18,7 @@ class Settings:
         "token_uri": os.getenv("FIREBASE_TOKEN_URI"),
         "auth_provider_x509_cert_url": os.getenv("FIREBASE_AUTH_PROVIDER_X509_CERT_URL"),
         "client_x509_cert_url": os.getenv("FIREBASE_CLIENT_X509_CERT_URL")
-    }
+    })
 
     # API Keys
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "demo_key")
@@ -34,13 +35,18 @@ class Settings:
     # Application Settings
     SESSION_SECRET = os.getenv("SESSION_SECRET", "default-secret-key")
     DEBUG = os.getenv("DEBUG", "False").lower() == "true"
+    ENABLE_CELEBRATIONS = os.getenv("ENABLE_CELEBRATIONS", "True").lower() == "true"
+
+    def __init__(self):
+        # Keys are read once at import, so demo mode is fixed for the process
+        self._demo_mode = (self.GEMINI_API_KEY == "demo_key" or 
+                           self.YOUTUBE_API_KEY == "demo_key" or
+                           not self.GEMINI_API_KEY or
+                           not self.YOUTUBE_API_KEY)
 
     @property
     def is_demo_mode(self) -> bool:
         """Check if running in demo mode (without real API keys)"""
-        return (self.GEMINI_API_KEY == "demo_key" or 
-                self.YOUTUBE_API_KEY == "demo_key" or
-                not self.GEMINI_API_KEY or
-                not self.YOUTUBE_API_KEY)
+        return self._demo_mode
 
 settings = Settings()
@@ -1,7 +1,11 @@
+import copy
 import json
 import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
+from google.cloud.firestore import FieldPath
 from config.firebase_config import firebase_config
 import streamlit as st
 
@@ -9,6 +13,17 @@ class FirestoreClient:
     def __init__(self):
         self.demo_data_file = "demo_data.json"
         self.ensure_demo_data_file()
+        
+        # Demo data is kept in memory and reloaded only if the file changes.
+        # The cached dict is read-only: records handed to callers are deep copies,
+        # and writes go through _updating_demo_data under the lock
+        self._demo_data = None
+        self._demo_data_mtime = None
+        self._demo_data_lock = threading.RLock()
+        
+        # Email -> user_id lookup, rebuilt whenever the demo data is reloaded
+        self._email_index = {}
+        self._email_index_source = None
 
     def ensure_demo_data_file(self):
         """Ensure demo data file exists"""
@@ -23,18 +38,48 @@ class FirestoreClient:
                 json.dump(demo_data, f, indent=2)
 
     def load_demo_data(self) -> Dict[str, Any]:
-        """Load demo data from file"""
-        try:
-            with open(self.demo_data_file, 'r') as f:
-                return json.load(f)
-        except:
-            self.ensure_demo_data_file()
-            return self.load_demo_data()
+        """Get demo data (read-only), re-reading the file only when it has been modified"""
+        with self._demo_data_lock:
+            try:
+                mtime = os.path.getmtime(self.demo_data_file)
+                if mtime != self._demo_data_mtime:
+                    with open(self.demo_data_file, 'r') as f:
+                        self._demo_data = json.load(f)
+                    self._demo_data_mtime = mtime
+                return self._demo_data
+            except:
+                self.ensure_demo_data_file()
+                return self.load_demo_data()
 
     def save_demo_data(self, data: Dict[str, Any]):
-        """Save demo data to file"""
-        with open(self.demo_data_file, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        """Write demo data to the file and cache what was written"""
+        with self._demo_data_lock:
+            text = json.dumps(data, indent=2, default=str)
+            with open(self.demo_data_file, 'w') as f:
+                f.write(text)
+            # Cache the parsed file contents rather than the caller's dict, so
+            # values match a reload (datetimes become strings) and later edits
+            # to the caller's objects don't leak in
+            self._demo_data = json.loads(text)
+            self._demo_data_mtime = os.path.getmtime(self.demo_data_file)
+
+    @contextmanager
+    def _updating_demo_data(self):
+        """Read-modify-write the demo data under the lock, on a private copy"""
+        with self._demo_data_lock:
+            data = copy.deepcopy(self.load_demo_data())
+            yield data
+            self.save_demo_data(data)
+
+    def _user_id_for_email(self, data: Dict[str, Any], email: str) -> Optional[str]:
+        """Look up a demo user's id by email, indexing the users once per load"""
+        if self._email_index_source is not data:
+            self._email_index = {}
+            for user_id, user_data in data['users'].items():
+                # The first match wins, as with the scan this replaces
+                self._email_index.setdefault(user_data.get('email'), user_id)
+            self._email_index_source = data
+        return self._email_index.get(email)
 
     def create_user_profile(self, user_id: str, user_data: Dict[str, Any]) -> bool:
         """Create user profile"""
@@ -45,9 +90,18 @@ class FirestoreClient:
                 return True
             else:
                 # Demo mode
-                data = self.load_demo_data()
-                data['users'][user_id] = user_data
-                self.save_demo_data(data)
+                with self._demo_data_lock:
+                    index_current = self._email_index_source is self.load_demo_data()
+                    with self._updating_demo_data() as data:
+                        replaced = user_id in data['users']
+                        data['users'][user_id] = user_data
+                    if index_current and not replaced:
+                        # Carry the index over to the newly cached data
+                        self._email_index.setdefault(user_data.get('email'), user_id)
+                        self._email_index_source = self._demo_data
+                    else:
+                        # The old email may still point here; rebuild on next lookup
+                        self._email_index_source = None
                 return True
         except Exception as e:
             st.error(f"Failed to create user profile: {str(e)}")
@@ -63,7 +117,8 @@ class FirestoreClient:
             else:
                 # Demo mode
                 data = self.load_demo_data()
-                return data['users'].get(user_id)
+                user_data = data['users'].get(user_id)
+                return copy.deepcopy(user_data) if user_data is not None else None
         except Exception as e:
             st.error(f"Failed to get user profile: {str(e)}")
             return None
@@ -83,11 +138,10 @@ class FirestoreClient:
             else:
                 # Demo mode
                 data = self.load_demo_data()
-                for user_id, user_data in data['users'].items():
-                    if user_data.get('email') == email:
-                        user_data['user_id'] = user_id
-                        return user_data
-                return None
+                user_id = self._user_id_for_email(data, email)
+                if user_id is None:
+                    return None
+                return {**copy.deepcopy(data['users'][user_id]), 'user_id': user_id}
         except Exception as e:
             st.error(f"Failed to get user by email: {str(e)}")
             return None
@@ -105,9 +159,8 @@ class FirestoreClient:
                 doc_ref.set(learning_path)
             else:
                 # Demo mode
-                data = self.load_demo_data()
-                data['learning_paths'][path_id] = learning_path
-                self.save_demo_data(data)
+                with self._updating_demo_data() as data:
+                    data['learning_paths'][path_id] = learning_path
 
             return path_id
         except Exception as e:
@@ -128,12 +181,86 @@ class FirestoreClient:
                 user_paths = []
                 for path_id, path_data in data['learning_paths'].items():
                     if path_data.get('user_id') == user_id:
-                        user_paths.append(path_data)
+                        user_paths.append(copy.deepcopy(path_data))
                 return user_paths
         except Exception as e:
             st.error(f"Failed to get learning paths: {str(e)}")
             return []
 
+    def get_user_learning_paths_page(self, user_id: str, limit: int,
+                                     start_after: Optional[Any] = None) -> Tuple[List[Dict[str, Any]], Optional[Any]]:
+        """Get one page of a user's learning paths, newest first
+
+        Returns the page and a cursor (the last path's (created_at, id)) to pass
+        as start_after for the next page, or None when there are no more paths.
+        The id breaks ties, so paths created in the same instant are not skipped
+        at a page boundary.
+        """
+        try:
+            return self.read_user_learning_paths_page(user_id, limit, start_after)
+        except Exception as e:
+            st.error(f"Failed to get learning paths: {str(e)}")
+            return [], None
+
+    def read_user_learning_paths_page(self, user_id: str, limit: int,
+                                      start_after: Optional[Any] = None) -> Tuple[List[Dict[str, Any]], Optional[Any]]:
+        """Like get_user_learning_paths_page, but raises on failure and never touches Streamlit
+
+        Safe to run on background threads, which have no script run context.
+        """
+        if firebase_config.is_initialized:
+            # Served by the (user_id, created_at desc, __name__ desc)
+            # composite index in firestore.indexes.json
+            query = (firebase_config.db.collection('learning_paths')
+                     .where('user_id', '==', user_id)
+                     .order_by('created_at', direction='DESCENDING')
+                     .order_by(FieldPath.document_id(), direction='DESCENDING')
+                     .limit(limit))
+            if start_after is not None:
+                created_at, path_id = start_after
+                query = query.start_after({'created_at': created_at, FieldPath.document_id(): path_id})
+            page = [doc.to_dict() for doc in query.stream()]
+        else:
+            # Demo mode (created_at is stored as a string)
+            data = self.load_demo_data()
+            def sort_key(path_data):
+                return str(path_data.get('created_at', '')), path_data.get('id', '')
+            
+            user_paths = sorted(
+                (path_data for path_data in data['learning_paths'].values()
+                 if path_data.get('user_id') == user_id),
+                key=sort_key,
+                reverse=True
+            )
+            if start_after is not None:
+                created_at, path_id = start_after
+                cursor_key = (str(created_at), path_id)
+                user_paths = [path_data for path_data in user_paths if sort_key(path_data) < cursor_key]
+            page = copy.deepcopy(user_paths[:limit])
+
+        cursor = (page[-1].get('created_at'), page[-1].get('id', '')) if len(page) == limit else None
+        return page, cursor
+
+    def get_learning_path(self, user_id: str, path_id: str) -> Optional[Dict[str, Any]]:
+        """Get a single learning path owned by the user"""
+        try:
+            if firebase_config.is_initialized:
+                doc = firebase_config.db.collection('learning_paths').document(path_id).get()
+                path_data = doc.to_dict() if doc.exists else None
+            else:
+                # Demo mode
+                data = self.load_demo_data()
+                path_data = data['learning_paths'].get(path_id)
+                if path_data is not None:
+                    path_data = copy.deepcopy(path_data)
+            
+            if path_data and path_data.get('user_id') == user_id:
+                return path_data
+            return None
+        except Exception as e:
+            st.error(f"Failed to get learning path: {str(e)}")
+            return None
+
     def update_learning_progress(self, user_id: str, path_id: str, day: int, completed: bool) -> bool:
         """Update learning progress"""
         try:
@@ -153,35 +280,97 @@ class FirestoreClient:
                 doc_ref.set(progress_data)
             else:
                 # Demo mode
-                data = self.load_demo_data()
-                if progress_key not in data['progress']:
-                    data['progress'][progress_key] = {'completed_days': {}}
-                
-                data['progress'][progress_key]['completed_days'][str(day)] = completed
-                data['progress'][progress_key]['last_updated'] = datetime.now().isoformat()
-                self.save_demo_data(data)
+                with self._updating_demo_data() as data:
+                    if progress_key not in data['progress']:
+                        data['progress'][progress_key] = {'completed_days': {}}
+                    
+                    data['progress'][progress_key]['completed_days'][str(day)] = completed
+                    data['progress'][progress_key]['last_updated'] = datetime.now().isoformat()
 
             return True
         except Exception as e:
             st.error(f"Failed to update progress: {str(e)}")
             return False
 
+    def update_learning_progress_batch(self, user_id: str, path_id: str, day_updates: Dict[int, bool]) -> bool:
+        """Update progress for several days in a single write"""
+        try:
+            self.write_learning_progress_batch(user_id, path_id, day_updates)
+            return True
+        except Exception as e:
+            st.error(f"Failed to update progress: {str(e)}")
+            return False
+
+    def write_learning_progress_batch(self, user_id: str, path_id: str, day_updates: Dict[int, bool]):
+        """Write progress for several days at once; raises on failure and never touches Streamlit
+
+        Safe to run on background threads, which have no script run context.
+        """
+        progress_key = f"{user_id}_{path_id}"
+        completed_days = {str(day): completed for day, completed in day_updates.items()}
+        last_updated = datetime.now().isoformat()
+        
+        if firebase_config.is_initialized:
+            # merge=True deep-merges the completed_days map, so no read is needed
+            doc_ref = firebase_config.db.collection('progress').document(progress_key)
+            doc_ref.set({'completed_days': completed_days, 'last_updated': last_updated}, merge=True)
+        else:
+            # Demo mode
+            with self._updating_demo_data() as data:
+                if progress_key not in data['progress']:
+                    data['progress'][progress_key] = {'completed_days': {}}
+                
+                data['progress'][progress_key]['completed_days'].update(completed_days)
+                data['progress'][progress_key]['last_updated'] = last_updated
+
     def get_learning_progress(self, user_id: str, path_id: str) -> Dict[str, Any]:
         """Get learning progress"""
         try:
-            progress_key = f"{user_id}_{path_id}"
-            
+            return self.read_learning_progress(user_id, path_id)
+        except Exception as e:
+            st.error(f"Failed to get progress: {str(e)}")
+            return {'completed_days': {}}
+
+    def read_learning_progress(self, user_id: str, path_id: str) -> Dict[str, Any]:
+        """Like get_learning_progress, but raises on failure and never touches Streamlit"""
+        progress_key = f"{user_id}_{path_id}"
+        
+        if firebase_config.is_initialized:
+            doc_ref = firebase_config.db.collection('progress').document(progress_key)
+            doc = doc_ref.get()
+            return doc.to_dict() if doc.exists else {'completed_days': {}}
+        else:
+            # Demo mode
+            data = self.load_demo_data()
+            return copy.deepcopy(data['progress'].get(progress_key, {'completed_days': {}}))
+
+    def save_path_reminders(self, user_id: str, reminders: Dict[str, Dict[str, Any]]) -> bool:
+        """Merge per-path reminder fields into notification_settings.reminders
+
+        ``reminders`` maps path id to the fields to set for that path; other
+        paths and fields already saved are left as they are.
+        """
+        try:
             if firebase_config.is_initialized:
-                doc_ref = firebase_config.db.collection('progress').document(progress_key)
-                doc = doc_ref.get()
-                return doc.to_dict() if doc.exists else {'completed_days': {}}
+                # Field paths update only the given fields, not the whole map
+                doc_ref = firebase_config.db.collection('users').document(user_id)
+                doc_ref.update({
+                    FieldPath('notification_settings', 'reminders', path_id, field).to_api_repr(): value
+                    for path_id, fields in reminders.items()
+                    for field, value in fields.items()
+                })
             else:
                 # Demo mode
-                data = self.load_demo_data()
-                return data['progress'].get(progress_key, {'completed_days': {}})
+                with self._updating_demo_data() as data:
+                    if user_id in data['users']:
+                        notification_settings = data['users'][user_id].setdefault('notification_settings', {})
+                        saved = notification_settings.setdefault('reminders', {})
+                        for path_id, fields in reminders.items():
+                            saved.setdefault(path_id, {}).update(fields)
+            return True
         except Exception as e:
-            st.error(f"Failed to get progress: {str(e)}")
-            return {'completed_days': {}}
+            st.error(f"Failed to save notification settings: {str(e)}")
+            return False
 
     def save_notification_settings(self, user_id: str, settings: Dict[str, Any]) -> bool:
         """Save notification settings"""
@@ -191,10 +380,9 @@ class FirestoreClient:
                 doc_ref.update({'notification_settings': settings})
             else:
                 # Demo mode
-                data = self.load_demo_data()
-                if user_id in data['users']:
-                    data['users'][user_id]['notification_settings'] = settings
-                    self.save_demo_data(data)
+                with self._updating_demo_data() as data:
+                    if user_id in data['users']:
+                        data['users'][user_id]['notification_settings'] = settings
             return True
         except Exception as e:
             st.error(f"Failed to save notification settings: {str(e)}")
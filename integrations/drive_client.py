@@ -1,6 +1,6 @@
 import os
 import json
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, BinaryIO
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -265,6 +265,20 @@ Creation Date: {learning_path.get('created_at', 'Unknown')}
             st.error(f"Failed to export PDF: {str(e)}")
             return None
 
+    def write_learning_path_pdf(self, learning_path: Dict[str, Any], fp: BinaryIO) -> bool:
+        """Write learning path PDF export to a binary file object"""
+        try:
+            content = self.export_learning_path_as_pdf(learning_path)
+            if content is None:
+                return False
+            
+            fp.write(content)
+            return True
+            
+        except Exception as e:
+            st.error(f"Failed to export PDF: {str(e)}")
+            return False
+
     def _create_demo_pdf(self, learning_path: Dict[str, Any]) -> bytes:
         """Create demo PDF content"""
         # Return empty bytes for demo - in real implementation, 
@@ -9,6 +9,8 @@ class ElevenLabsClient:
         self.api_key = settings.ELEVENLABS_API_KEY
         self.base_url = "https://api.elevenlabs.io/v1"
         self.demo_mode = self.api_key == "demo_key" or not self.api_key
+        # MIME type of the audio returned: ElevenLabs sends MP3, the demo placeholder is WAV
+        self.audio_format = "audio/wav" if self.demo_mode else "audio/mpeg"
 
     def text_to_speech(self, text: str, voice_id: str = "21m00Tcm4TlvDq8ikWAM") -> Optional[bytes]:
         """Convert text to speech using ElevenLabs API"""
@@ -17,35 +19,43 @@ class ElevenLabsClient:
             return self._generate_demo_audio(text)
 
         try:
-            url = f"{self.base_url}/text-to-speech/{voice_id}"
-            
-            headers = {
-                "Accept": "audio/mpeg",
-                "Content-Type": "application/json",
-                "xi-api-key": self.api_key
-            }
-            
-            data = {
-                "text": text,
-                "model_id": "eleven_monolingual_v1",
-                "voice_settings": {
-                    "stability": 0.5,
-                    "similarity_boost": 0.5
-                }
-            }
-            
-            response = requests.post(url, json=data, headers=headers)
-            
-            if response.status_code == 200:
-                return response.content
-            else:
-                st.error(f"ElevenLabs API error: {response.status_code}")
-                return None
-                
+            return self.synthesize(text, voice_id)
         except Exception as e:
             st.error(f"Failed to generate audio: {str(e)}")
             return None
 
+    def synthesize(self, text: str, voice_id: str = "21m00Tcm4TlvDq8ikWAM") -> bytes:
+        """Call the text-to-speech API; raises on failure and never touches Streamlit
+
+        Safe to run on background threads, which have no script run context.
+        """
+        url = f"{self.base_url}/text-to-speech/{voice_id}"
+        
+        headers = {
+            "Accept": "audio/mpeg",
+            "Content-Type": "application/json",
+            "xi-api-key": self.api_key
+        }
+        
+        data = {
+            "text": text,
+            "model_id": "eleven_monolingual_v1",
+            "voice_settings": {
+                "stability": 0.5,
+                "similarity_boost": 0.5
+            }
+        }
+        
+        response = requests.post(url, json=data, headers=headers)
+        
+        if response.status_code != 200:
+            raise RuntimeError(f"ElevenLabs API error: {response.status_code}")
+        return response.content
+
+    def synthesize_daily_plan(self, daily_plan: dict) -> bytes:
+        """Narrate a daily plan via synthesize (raises on failure, no Streamlit calls)"""
+        return self.synthesize(self._format_daily_plan_for_audio(daily_plan))
+
     def _generate_demo_audio(self, text: str) -> bytes:
         """Generate demo audio placeholder"""
         # Return a minimal WAV file header for demo purposes
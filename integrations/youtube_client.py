@@ -1,9 +1,13 @@
 import os
+import re
 import requests
 from typing import List, Dict, Any, Optional
 from config.settings import settings
 import streamlit as st
 
+# ISO 8601 video duration (PT10M30S format)
+_ISO_DURATION_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+
 class YouTubeClient:
     def __init__(self):
         self.api_key = settings.YOUTUBE_API_KEY
@@ -208,9 +212,7 @@ class YouTubeClient:
         """Format YouTube duration string to readable format"""
         try:
             # Parse ISO 8601 duration (PT10M30S format)
-            import re
-            pattern = r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?'
-            match = re.match(pattern, duration_str)
+            match = _ISO_DURATION_RE.match(duration_str)
             
             if match:
                 hours, minutes, seconds = match.groups()
@@ -291,6 +291,7 @@ class APIKeyManager:
                 with open(f"user_keys_{user_id}.json", 'w') as f:
                     json.dump(existing_keys, f, indent=2)
             
+            st.session_state.pop(f"has_required_keys_{user_id}", None)
             return True
         except Exception as e:
             st.error(f"Failed to save API keys: {str(e)}")
@@ -303,9 +304,14 @@ class APIKeyManager:
 
     def has_required_keys(self, user_id: str) -> bool:
         """Check if user has all required API keys"""
-        user_keys = self.get_user_api_keys(user_id)
-        required_apis = [k for k, v in self.supported_apis.items() if v['required']]
-        return all(user_keys.get(key) for key in required_apis)
+        # Remembered per session so pages that check on every rerun don't
+        # re-read the stored keys; saving keys clears it
+        cache_key = f"has_required_keys_{user_id}"
+        if cache_key not in st.session_state:
+            user_keys = self.get_user_api_keys(user_id)
+            required_apis = [k for k, v in self.supported_apis.items() if v['required']]
+            st.session_state[cache_key] = all(user_keys.get(key) for key in required_apis)
+        return st.session_state[cache_key]
 
 # Global instance
 api_key_manager = APIKeyManager()
\ No newline at end of file
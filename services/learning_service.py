@@ -1,4 +1,6 @@
-from typing import Dict, Any, List, Optional
+import codecs
+import json
+from typing import Dict, Any, List, Optional, Tuple, BinaryIO, Callable
 from datetime import datetime, timedelta
 import streamlit as st
 from ai_services.gemini_client import gemini_client
@@ -8,6 +10,11 @@ from integrations.youtube_client import youtube_client
 from integrations.drive_client import drive_client
 from integrations.elevenlabs_client import elevenlabs_client
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class LearningService:
     def __init__(self):
         pass
@@ -126,8 +133,9 @@ class LearningService:
         """Initialize progress tracking for the learning path"""
         try:
             # Initialize empty progress
-            for day in range(1, duration + 1):
-                firestore_client.update_learning_progress(user_id, path_id, day, False)
+            firestore_client.update_learning_progress_batch(
+                user_id, path_id, {day: False for day in range(1, duration + 1)}
+            )
         except Exception as e:
             st.error(f"Failed to initialize progress tracking: {str(e)}")
 
@@ -137,14 +145,7 @@ class LearningService:
             learning_paths = firestore_client.get_user_learning_paths(user_id)
             
             # Enhance with progress data
-            for path in learning_paths:
-                path_id = path.get('id', '')
-                if path_id:
-                    progress = firestore_client.get_learning_progress(user_id, path_id)
-                    path['progress'] = progress
-                    path['completion_percentage'] = self._calculate_completion_percentage(
-                        progress, path.get('duration_days', 0)
-                    )
+            self._attach_progress(user_id, learning_paths)
             
             return learning_paths
             
@@ -152,11 +153,64 @@ class LearningService:
             st.error(f"Failed to get learning paths: {str(e)}")
             return []
 
+    def get_user_learning_paths_page(self, user_id: str, limit: int = 5,
+                                     cursor: Optional[Any] = None) -> Tuple[List[Dict[str, Any]], Optional[Any]]:
+        """Get one page of a user's learning paths (newest first) and the next-page cursor"""
+        try:
+            return self.read_user_learning_paths_page(user_id, limit, cursor)
+            
+        except Exception as e:
+            st.error(f"Failed to get learning paths: {str(e)}")
+            return [], None
+
+    def read_user_learning_paths_page(self, user_id: str, limit: int = 5,
+                                      cursor: Optional[Any] = None) -> Tuple[List[Dict[str, Any]], Optional[Any]]:
+        """Get one page of learning paths with progress; raises on failure, no Streamlit calls (background-thread safe)"""
+        learning_paths, next_cursor = firestore_client.read_user_learning_paths_page(
+            user_id, limit, start_after=cursor
+        )
+        
+        # Enhance with progress data
+        self._attach_progress(user_id, learning_paths, firestore_client.read_learning_progress)
+        
+        return learning_paths, next_cursor
+
+    def _attach_progress(self, user_id: str, learning_paths: List[Dict[str, Any]],
+                         get_progress: Optional[Callable[[str, str], Dict[str, Any]]] = None):
+        """Add progress and completion percentage to each learning path"""
+        get_progress = get_progress or firestore_client.get_learning_progress
+        for path in learning_paths:
+            path_id = path.get('id', '')
+            if path_id:
+                progress = get_progress(user_id, path_id)
+                path['progress'] = progress
+                path['completion_percentage'] = self._calculate_completion_percentage(
+                    progress, path.get('duration_days', 0)
+                )
+
+    def get_learning_path(self, user_id: str, path_id: str) -> Optional[Dict[str, Any]]:
+        """Get a single learning path with its progress data"""
+        try:
+            path = firestore_client.get_learning_path(user_id, path_id)
+            
+            if path:
+                progress = firestore_client.get_learning_progress(user_id, path_id)
+                path['progress'] = progress
+                path['completion_percentage'] = self._calculate_completion_percentage(
+                    progress, path.get('duration_days', 0)
+                )
+            
+            return path
+            
+        except Exception as e:
+            st.error(f"Failed to get learning path: {str(e)}")
+            return None
+
     def _calculate_completion_percentage(self, progress: Dict[str, Any], total_days: int) -> float:
         """Calculate completion percentage"""
         try:
             completed_days = progress.get('completed_days', {})
-            completed_count = sum(1 for completed in completed_days.values() if completed)
+            completed_count = sum(map(bool, completed_days.values()))
             return (completed_count / total_days * 100) if total_days > 0 else 0
         except:
             return 0
@@ -164,97 +218,86 @@ class LearningService:
     def update_daily_progress(self, user_id: str, path_id: str, day: int, completed: bool) -> bool:
         """Update progress for a specific day"""
         try:
-            success = firestore_client.update_learning_progress(user_id, path_id, day, completed)
-            
-            if success and completed:
-                # Track analytics for MCP paths
-                self._track_enhanced_mcp_progress(user_id, path_id, day)
-                
-            return success
+            return firestore_client.update_learning_progress(user_id, path_id, day, completed)
             
         except Exception as e:
             st.error(f"Failed to update progress: {str(e)}")
             return False
 
-    def _track_enhanced_mcp_progress(self, user_id: str, path_id: str, day: int):
-        """Track progress for MCP analytics"""
+    def update_daily_progress_batch(self, user_id: str, path_id: str, day_updates: Dict[int, bool]) -> bool:
+        """Update progress for several days with a single write"""
         try:
-            daily_progress = {
-                'day': day,
-                'completed': True,
-                'time_spent': 60,  # Default estimate
-                'difficulty_rating': 3,  # Default rating
-                'satisfaction': 4,  # Default satisfaction
-                'timestamp': datetime.now()
-            }
-            
-            enhanced_mcp_integration.track_learning_progress(user_id, path_id, daily_progress)
+            return firestore_client.update_learning_progress_batch(user_id, path_id, day_updates)
             
         except Exception as e:
-            st.error(f"Failed to track MCP progress: {str(e)}")
+            st.error(f"Failed to update progress: {str(e)}")
+            return False
+
+    def write_daily_progress_batch(self, user_id: str, path_id: str, day_updates: Dict[int, bool]):
+        """Write progress for several days; raises on failure, no Streamlit calls (background-thread safe)"""
+        firestore_client.write_learning_progress_batch(user_id, path_id, day_updates)
 
-    def get_learning_analytics(self, user_id: str) -> Dict[str, Any]:
-        """Get learning analytics for user"""
+    def get_learning_analytics(self, user_id: str,
+                               learning_paths: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Get learning analytics for user (reuses learning_paths if already fetched)"""
         try:
-            learning_paths = self.get_user_learning_paths(user_id)
-            
-            analytics = {
-                'total_paths': len(learning_paths),
-                'completed_paths': 0,
-                'active_paths': 0,
-                'total_days_studied': 0,
-                'average_completion_rate': 0,
-                'longest_streak': 0,
-                'current_streak': 0
-            }
+            if learning_paths is None:
+                learning_paths = self.get_user_learning_paths(user_id)
             
+            total_paths = len(learning_paths)
+            completed_paths = 0
+            active_paths = 0
+            total_days_studied = 0
             total_completion = 0
             
+            # Single pass over the paths, accumulating into locals
             for path in learning_paths:
                 completion_rate = path.get('completion_percentage', 0)
                 total_completion += completion_rate
                 
                 if completion_rate >= 100:
-                    analytics['completed_paths'] += 1
+                    completed_paths += 1
                 elif completion_rate > 0:
-                    analytics['active_paths'] += 1
+                    active_paths += 1
                 
                 # Count completed days
-                progress = path.get('progress', {})
-                completed_days = progress.get('completed_days', {})
-                analytics['total_days_studied'] += sum(
-                    1 for completed in completed_days.values() if completed
-                )
-            
-            # Calculate average completion rate
-            if analytics['total_paths'] > 0:
-                analytics['average_completion_rate'] = total_completion / analytics['total_paths']
-            
-            return analytics
+                completed_days = path.get('progress', {}).get('completed_days', {})
+                total_days_studied += sum(map(bool, completed_days.values()))
+            
+            return {
+                'total_paths': total_paths,
+                'completed_paths': completed_paths,
+                'active_paths': active_paths,
+                'total_days_studied': total_days_studied,
+                # Calculate average completion rate
+                'average_completion_rate': total_completion / total_paths if total_paths > 0 else 0,
+                'longest_streak': 0,
+                'current_streak': 0
+            }
             
         except Exception as e:
             st.error(f"Failed to get learning analytics: {str(e)}")
             return {}
 
-    def get_learning_recommendations(self, user_id: str) -> List[Dict[str, Any]]:
-        """Get learning recommendations for user"""
+    def get_learning_recommendations(self, user_id: str,
+                                     learning_paths: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """Get learning recommendations for user (reuses learning_paths if already fetched)"""
         try:
             # Get user's learning history
-            learning_paths = self.get_user_learning_paths(user_id)
+            if learning_paths is None:
+                learning_paths = self.get_user_learning_paths(user_id)
             
             recommendations = []
             
-            # Analyze completed paths to suggest next steps
-            completed_goals = []
-            difficulty_levels = []
-            
-            for path in learning_paths:
-                if path.get('completion_percentage', 0) >= 80:
-                    completed_goals.append(path.get('goal', ''))
-                    difficulty_levels.append(path.get('difficulty', 'beginner'))
+            # Analyze completed paths to suggest next steps; the goals are
+            # lowercased and joined once for all keyword checks below
+            completed_goals = ' '.join(
+                path.get('goal', '') for path in learning_paths
+                if path.get('completion_percentage', 0) >= 80
+            ).lower()
             
             # Generate recommendations based on history
-            if 'python' in str(completed_goals).lower():
+            if 'python' in completed_goals:
                 recommendations.append({
                     'title': 'Advanced Python Development',
                     'description': 'Take your Python skills to the next level with advanced concepts',
@@ -263,7 +306,7 @@ class LearningService:
                     'type': 'mcp'
                 })
             
-            if 'javascript' in str(completed_goals).lower():
+            if 'javascript' in completed_goals:
                 recommendations.append({
                     'title': 'React.js Framework',
                     'description': 'Learn modern JavaScript framework for building user interfaces',
@@ -296,42 +339,46 @@ class LearningService:
             st.error(f"Failed to get recommendations: {str(e)}")
             return []
 
-    def export_learning_path(self, user_id: str, path_id: str, format_type: str = 'pdf') -> Optional[bytes]:
-        """Export learning path in specified format"""
+    def export_learning_path(self, user_id: str, path_id: str, fp: BinaryIO, format_type: str = 'pdf') -> bool:
+        """Write learning path export in specified format to a binary file object"""
         try:
             # Get learning path data
-            learning_paths = self.get_user_learning_paths(user_id)
-            learning_path = None
-            
-            for path in learning_paths:
-                if path.get('id') == path_id:
-                    learning_path = path
-                    break
+            learning_path = self.get_learning_path(user_id, path_id)
             
             if not learning_path:
                 st.error("Learning path not found")
-                return None
+                return False
             
             if format_type.lower() == 'pdf':
-                return drive_client.export_learning_path_as_pdf(learning_path)
+                return drive_client.write_learning_path_pdf(learning_path, fp)
             elif format_type.lower() == 'json':
-                import json
-                return json.dumps(learning_path, indent=2, default=str).encode('utf-8')
+                if orjson is not None:
+                    # Datetimes go through default=str so output matches the stdlib path
+                    fp.write(orjson.dumps(
+                        learning_path, default=str,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME
+                    ))
+                else:
+                    # Encode incrementally as json.dump emits chunks
+                    json.dump(learning_path, codecs.getwriter('utf-8')(fp), indent=2, default=str)
+                return True
             else:
                 st.error(f"Unsupported export format: {format_type}")
-                return None
+                return False
                 
         except Exception as e:
             st.error(f"Failed to export learning path: {str(e)}")
-            return None
+            return False
 
     def save_enhanced_learning_path(self, user_id: str, learning_path: Dict[str, Any]) -> Optional[str]:
         """Save enhanced MCP learning path"""
         try:
-            path_id = f"enhanced_mcp_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            # One clock read so the id and created_at agree
+            now = datetime.now()
+            path_id = f"enhanced_mcp_{now.strftime('%Y%m%d_%H%M%S')}"
             learning_path['id'] = path_id
             learning_path['user_id'] = user_id
-            learning_path['created_at'] = datetime.now()
+            learning_path['created_at'] = now
             learning_path['enhanced_mcp'] = True
 
             # Enhance with multimedia content
@@ -359,13 +406,7 @@ class LearningService:
         """Duplicate an existing learning path"""
         try:
             # Get original learning path
-            learning_paths = self.get_user_learning_paths(user_id)
-            original_path = None
-            
-            for path in learning_paths:
-                if path.get('id') == path_id:
-                    original_path = path
-                    break
+            original_path = firestore_client.get_learning_path(user_id, path_id)
             
             if not original_path:
                 st.error("Original learning path not found")
@@ -7,6 +7,12 @@ import threading
 from integrations.twilio_client import twilio_client
 from database.firestore_client import firestore_client
 
+# Weekday indices for every 7-bit reminder days mask, decoded once at import
+_WEEKDAYS_BY_MASK = tuple(
+    tuple(day for day in range(7) if mask & (1 << day))
+    for mask in range(1 << 7)
+)
+
 class NotificationService:
     def __init__(self):
         self.scheduled_notifications = {}
@@ -21,20 +27,14 @@ class NotificationService:
             phone_number = reminder_settings.get('phone_number', '')
             notification_method = reminder_settings.get('method', 'sms')  # sms, whatsapp, voice
             reminder_time = reminder_settings.get('time', '09:00')  # HH:MM format
-            days_to_remind = reminder_settings.get('days', [1, 2, 3, 4, 5])  # Mon-Fri
+            days_to_remind = self._get_reminder_days(reminder_settings)
             
             if not phone_number:
                 st.error("Phone number is required for notifications")
                 return False
             
             # Get learning path details
-            learning_paths = firestore_client.get_user_learning_paths(user_id)
-            learning_path = None
-            
-            for path in learning_paths:
-                if path.get('id') == path_id:
-                    learning_path = path
-                    break
+            learning_path = firestore_client.get_learning_path(user_id, path_id)
             
             if not learning_path:
                 st.error("Learning path not found")
@@ -58,12 +58,11 @@ class NotificationService:
             
             self.scheduled_notifications[notification_key] = notification_data
             
-            # Save to database
-            firestore_client.save_notification_settings(user_id, {
-                'path_id': path_id,
-                'settings': reminder_settings,
-                'active': True
-            })
+            # Save to database, merged into the user's other path reminders
+            if not firestore_client.save_path_reminders(user_id, {
+                path_id: {'settings': reminder_settings, 'active': True}
+            }):
+                return False
             
             st.success(f"Learning reminders scheduled for {reminder_time} daily!")
             return True
@@ -72,18 +71,19 @@ class NotificationService:
             st.error(f"Failed to schedule reminders: {str(e)}")
             return False
 
+    def _get_reminder_days(self, reminder_settings: Dict[str, Any]) -> List[int]:
+        """Get reminder weekday indices from a 'days_mask' bitmask or a 'days' list"""
+        days_mask = reminder_settings.get('days_mask')
+        if days_mask is None:
+            return reminder_settings.get('days', [0, 1, 2, 3, 4])  # Mon-Fri (Monday = 0)
+        return list(_WEEKDAYS_BY_MASK[days_mask & 0x7F])
+
     def send_immediate_reminder(self, user_id: str, path_id: str, 
                               phone_number: str, method: str = 'sms') -> bool:
         """Send an immediate learning reminder"""
         try:
             # Get learning path details
-            learning_paths = firestore_client.get_user_learning_paths(user_id)
-            learning_path = None
-            
-            for path in learning_paths:
-                if path.get('id') == path_id:
-                    learning_path = path
-                    break
+            learning_path = firestore_client.get_learning_path(user_id, path_id)
             
             if not learning_path:
                 st.error("Learning path not found")
@@ -137,16 +137,15 @@ class NotificationService:
                                 learning_path: Dict[str, Any]) -> int:
         """Determine current learning day based on progress"""
         try:
-            completed_days = progress.get('completed_days', {})
+            mask = self._completed_days_mask(progress.get('completed_days', {}))
             total_days = learning_path.get('duration_days', 7)
             
-            # Find the next incomplete day
-            for day in range(1, total_days + 1):
-                if not completed_days.get(str(day), False):
-                    return day
+            # Find the next incomplete day: the lowest clear bit above bit 0
+            incomplete = ~(mask | 1)
+            day = (incomplete & -incomplete).bit_length() - 1
             
             # If all days are complete, return the last day
-            return total_days
+            return min(day, total_days)
             
         except:
             return 1
@@ -156,13 +155,7 @@ class NotificationService:
         """Send completion celebration message"""
         try:
             # Get learning path details
-            learning_paths = firestore_client.get_user_learning_paths(user_id)
-            learning_path = None
-            
-            for path in learning_paths:
-                if path.get('id') == path_id:
-                    learning_path = path
-                    break
+            learning_path = firestore_client.get_learning_path(user_id, path_id)
             
             if not learning_path:
                 return False
@@ -172,7 +165,7 @@ class NotificationService:
             completed_days = progress.get('completed_days', {})
             total_days = learning_path.get('duration_days', 0)
             
-            completion_rate = (sum(1 for completed in completed_days.values() if completed) 
+            completion_rate = (sum(map(bool, completed_days.values())) 
                              / total_days * 100) if total_days > 0 else 0
             
             # Create completion data
@@ -202,13 +195,7 @@ class NotificationService:
         """Send motivational message based on progress"""
         try:
             # Get learning path and progress
-            learning_paths = firestore_client.get_user_learning_paths(user_id)
-            learning_path = None
-            
-            for path in learning_paths:
-                if path.get('id') == path_id:
-                    learning_path = path
-                    break
+            learning_path = firestore_client.get_learning_path(user_id, path_id)
             
             if not learning_path:
                 return False
@@ -217,7 +204,7 @@ class NotificationService:
             completed_days = progress.get('completed_days', {})
             total_days = learning_path.get('duration_days', 0)
             
-            completion_rate = (sum(1 for completed in completed_days.values() if completed) 
+            completion_rate = (sum(map(bool, completed_days.values())) 
                              / total_days * 100) if total_days > 0 else 0
             
             # Calculate streak
@@ -247,28 +234,30 @@ class NotificationService:
             return False
 
     def _calculate_streak(self, completed_days: Dict[str, bool]) -> int:
-        """Calculate current learning streak"""
+        """Calculate current learning streak (consecutive days ending at the latest completed day)"""
         try:
-            # Convert to sorted list of day numbers
-            days = sorted([int(day) for day in completed_days.keys()])
-            
-            if not days:
+            if not completed_days:
                 return 0
             
-            # Calculate streak from the end
-            streak = 0
-            for i in range(len(days) - 1, -1, -1):
-                day = days[i]
-                if completed_days.get(str(day), False):
-                    streak += 1
-                else:
-                    break
+            mask = self._completed_days_mask(completed_days)
             
-            return streak
+            # The run of set bits below the highest completed day ends at the
+            # highest clear bit, so the streak falls out of two bit_length calls
+            top = mask.bit_length()
+            gaps = ~mask & ((1 << top) - 1)
+            return top - gaps.bit_length()
             
         except:
             return 0
 
+    def _completed_days_mask(self, completed_days: Dict[str, bool]) -> int:
+        """Pack completed days into an int bitmask (bit n set means day n is done)"""
+        mask = 0
+        for day, completed in completed_days.items():
+            if completed:
+                mask |= 1 << int(day)
+        return mask
+
     def _log_notification_sent(self, user_id: str, path_id: str, 
                              notification_type: str, method: str):
         """Log sent notification"""
@@ -294,18 +283,19 @@ class NotificationService:
         try:
             # In a real implementation, this would fetch from database
             # For demo, return sample data
+            now = datetime.now()
             return [
                 {
                     'type': 'reminder',
                     'method': 'sms',
-                    'sent_at': datetime.now() - timedelta(days=1),
+                    'sent_at': now - timedelta(days=1),
                     'status': 'delivered',
                     'path_goal': 'Python Programming'
                 },
                 {
                     'type': 'motivation',
                     'method': 'whatsapp',
-                    'sent_at': datetime.now() - timedelta(days=3),
+                    'sent_at': now - timedelta(days=3),
                     'status': 'delivered',
                     'path_goal': 'Data Science'
                 }
@@ -324,10 +314,8 @@ class NotificationService:
                 self.scheduled_notifications[notification_key]['active'] = False
                 
                 # Update database
-                firestore_client.save_notification_settings(user_id, {
-                    'path_id': path_id,
-                    'active': False,
-                    'cancelled_at': datetime.now()
+                firestore_client.save_path_reminders(user_id, {
+                    path_id: {'active': False, 'cancelled_at': datetime.now()}
                 })
                 
                 st.success("Scheduled reminders cancelled successfully!")
@@ -351,11 +339,8 @@ class NotificationService:
                 self.scheduled_notifications[notification_key].update(new_settings)
                 
                 # Save to database
-                firestore_client.save_notification_settings(user_id, {
-                    'path_id': path_id,
-                    'settings': new_settings,
-                    'updated_at': datetime.now(),
-                    'active': True
+                firestore_client.save_path_reminders(user_id, {
+                    path_id: {'settings': new_settings, 'updated_at': datetime.now(), 'active': True}
                 })
                 
                 st.success("Notification settings updated successfully!")
@@ -1,20 +1,33 @@
 import hashlib
+import hmac
 import secrets
 import string
 import re
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 import streamlit as st
 
+# Precompiled validation patterns
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_NON_DIGIT_RE = re.compile(r'\D')
+_MAX_EMAIL_LENGTH = 254
+_MAX_PHONE_LENGTH = 32
+
 def validate_email(email: str) -> bool:
     """Validate email format"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    # Bound the input so the pattern can't backtrack over huge strings
+    return len(email) <= _MAX_EMAIL_LENGTH and _EMAIL_RE.fullmatch(email) is not None
 
+@lru_cache(maxsize=256)
 def validate_phone_number(phone: str) -> bool:
     """Validate phone number format"""
+    # Reject oversized input before scanning it; formatted numbers with up
+    # to 15 digits fit comfortably
+    if len(phone) > _MAX_PHONE_LENGTH:
+        return False
     # Remove all non-digit characters
-    cleaned = re.sub(r'\D', '', phone)
+    cleaned = _NON_DIGIT_RE.sub('', phone)
     # Check if it's a valid length (10-15 digits)
     return 10 <= len(cleaned) <= 15
 
@@ -26,11 +39,11 @@ def hash_password(password: str) -> str:
 
 def verify_password(password: str, hashed: str) -> bool:
     """Verify password against hash"""
-    try:
-        salt, password_hash = hashed.split(':')
-        return hashlib.sha256((password + salt).encode()).hexdigest() == password_hash
-    except ValueError:
+    salt, sep, password_hash = hashed.partition(':')
+    if not sep:
         return False
+    # Constant-time comparison so response timing doesn't leak the hash
+    return hmac.compare_digest(hashlib.sha256((password + salt).encode()).hexdigest(), password_hash)
 
 def generate_secure_token(length: int = 32) -> str:
     """Generate a secure random token"""
@@ -78,6 +91,7 @@ def format_progress_percentage(completed: int, total: int) -> float:
         return 0.0
     return round((completed / total) * 100, 1)
 
+@lru_cache(maxsize=8)
 def get_difficulty_color(difficulty: str) -> str:
     """Get color code for difficulty level"""
     colors = {
@@ -88,12 +102,16 @@ def get_difficulty_color(difficulty: str) -> str:
     }
     return colors.get(difficulty.lower(), '#757575')  # Default gray
 
-def format_date_relative(date: datetime) -> str:
-    """Format date as relative time (e.g., '2 days ago')"""
+def format_date_relative(date: datetime, *, now: Optional[datetime] = None) -> str:
+    """Format date as relative time (e.g., '2 days ago')
+
+    Pass a timezone-aware ``now`` to reuse one reference time across many calls.
+    """
     if not isinstance(date, datetime):
         return "Unknown"
 
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc)
     if date.tzinfo is None:
         date = date.replace(tzinfo=timezone.utc)
 
@@ -188,38 +206,43 @@ def generate_color_palette(count: int) -> List[str]:
 
 def validate_learning_goal(goal: str) -> bool:
     """Validate learning goal input"""
-    if not goal or len(goal.strip()) < 3:
+    if not goal:
         return False
 
-    # Check for meaningful content
-    words = goal.strip().split()
-    return len(words) >= 2 and len(goal.strip()) <= 200
+    stripped = goal.strip()
+    if not 3 <= len(stripped) <= 200:
+        return False
 
-def estimate_learning_duration(goal: str, difficulty: str) -> Dict[str, int]:
-    """Estimate appropriate learning duration based on goal and difficulty"""
-    base_days = {
-        'beginner': 7,
-        'intermediate': 14,
-        'advanced': 21,
-        'expert': 30
-    }
+    # Check for meaningful content (at least two words)
+    return len(stripped.split(maxsplit=1)) == 2
 
-    goal_lower = goal.lower()
-    complexity_indicators = ['programming', 'development', 'advanced', 'professional', 'certification']
+_BASE_LEARNING_DAYS = {
+    'beginner': 7,
+    'intermediate': 14,
+    'advanced': 21,
+    'expert': 30
+}
+_COMPLEXITY_INDICATORS = ('programming', 'development', 'advanced', 'professional', 'certification')
 
-    multiplier = 1.0
-    for indicator in complexity_indicators:
-        if indicator in goal_lower:
-            multiplier = 1.5
-            break
+@lru_cache(maxsize=1024)
+def _estimate_duration_bounds(goal: str, difficulty: str) -> tuple:
+    """Compute (min, recommended, max) days; cached as an immutable tuple"""
+    goal_lower = goal.lower()
+    multiplier = 1.5 if any(indicator in goal_lower for indicator in _COMPLEXITY_INDICATORS) else 1.0
 
-    base = base_days.get(difficulty.lower(), 14)
+    base = _BASE_LEARNING_DAYS.get(difficulty.lower(), 14)
     estimated = int(base * multiplier)
 
+    return max(3, estimated - 5), estimated, min(90, estimated + 10)
+
+def estimate_learning_duration(goal: str, difficulty: str) -> Dict[str, int]:
+    """Estimate appropriate learning duration based on goal and difficulty"""
+    # A fresh dict per call, so callers can't mutate the cached result
+    min_days, recommended_days, max_days = _estimate_duration_bounds(goal, difficulty)
     return {
-        'min_days': max(3, estimated - 5),
-        'recommended_days': estimated,
-        'max_days': min(90, estimated + 10)
+        'min_days': min_days,
+        'recommended_days': recommended_days,
+        'max_days': max_days
     }
 
 class SessionState: